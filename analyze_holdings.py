@@ -7,17 +7,21 @@ Run: python analyze_holdings.py
 
 import json
 import csv
+import heapq
 import re
 from pathlib import Path
-from collections import Counter, defaultdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 
+import orjson
 
-def load_json(path):
+
+def load_json(path: Path):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
+        return orjson.loads(path.read_bytes())
+    except Exception:
         return None
 
 
@@ -31,7 +35,7 @@ def parse_number(val):
     s = s.replace("(", "-").replace(")", "")
     try:
         return float(s)
-    except:
+    except ValueError:
         return None
 
 
@@ -53,13 +57,138 @@ def extract_soi_rows(data: dict):
     return []
 
 
+# Column order for all_holdings.csv; matches the holding dicts built in process_one
+HOLDING_FIELDS = [
+    "file",
+    "investment",
+    "fair_value",
+    "quantity",
+    "quantity_type",
+    "interest_rate",
+    "maturity_date",
+    "section_path",
+    "row_text",
+]
+
+
 def get_row_value(row):
     """Get the value dict from a row (handles {value: {...}, citations: []} structure)."""
-    if isinstance(row, dict):
-        if "value" in row and isinstance(row["value"], dict):
-            return row["value"]
-        return row
-    return {}
+    # Exact type checks: orjson only produces plain dicts, and `type(x) is dict`
+    # is cheaper than isinstance on this per-row path.
+    if type(row) is not dict:
+        return {}
+    inner = row.get("value")
+    return inner if type(inner) is dict else row
+
+
+def get_section_parts(section_path: list) -> list:
+    """Convert section_path items (plain or {value, citations}) to strings."""
+    _str = str
+    _dict = dict
+    return [
+        _str(item.get("value", item)) if type(item) is _dict else _str(item)
+        for item in section_path
+    ]
+
+
+def process_one(path: Path) -> dict:
+    """
+    Parse one extract response into per-file partial aggregates.
+
+    Runs in a worker process, so it only returns plain picklable data; the
+    parent merges the results from every file.
+    """
+    partial = {
+        "stem": path.stem.replace("_extract_response", ""),
+        "status": None,
+        "holdings": [],
+        "subtotals": [],
+        "field_usage": defaultdict(int),
+        "row_type_counts": defaultdict(int),
+        "section_paths": defaultdict(int),
+    }
+    
+    data = load_json(path)
+    if not data:
+        return partial
+    
+    stem = partial["stem"]
+    holdings = partial["holdings"]
+    subtotals = partial["subtotals"]
+    field_usage = partial["field_usage"]
+    row_type_counts = partial["row_type_counts"]
+    section_paths = partial["section_paths"]
+    
+    # Check for split job
+    result = data.get("result", {})
+    if isinstance(result, dict):
+        inner = result.get("result", result)
+        if isinstance(inner, dict) and "splits" in inner:
+            partial["status"] = "split"
+            return partial
+    
+    soi_rows = extract_soi_rows(data)
+    
+    if not soi_rows:
+        partial["status"] = "empty"
+        return partial
+    
+    partial["status"] = "data"
+    
+    for row in soi_rows:
+        val = get_row_value(row)
+        vg = val.get
+        
+        # Track field usage
+        for k in val.keys():
+            field_usage[k] += 1
+        
+        row_type = vg("row_type", "UNKNOWN")
+        if isinstance(row_type, dict):
+            row_type = row_type.get("value", "UNKNOWN")
+        row_type = str(row_type)
+        row_type_counts[row_type] += 1
+        
+        # Convert section_path to strings once; the counter uses the top two
+        # levels and the holding/subtotal records use the full path.
+        section_path = vg("section_path")
+        if section_path and type(section_path) is list:
+            sp_strs = get_section_parts(section_path)
+            section_paths[" > ".join(sp_strs[:2])] += 1
+            section_str = " > ".join(sp_strs)
+        else:
+            section_str = ""
+        
+        if row_type == "HOLDING":
+            investment = val["investment"] if "investment" in val else vg("label", "")
+            if isinstance(investment, dict):
+                investment = investment.get("value", str(investment))
+            
+            holding = {
+                "file": stem,
+                "investment": str(investment)[:200] if investment else "",
+                "fair_value": parse_number(vg("fair_value_raw")),
+                "quantity": parse_number(vg("quantity_raw")),
+                "quantity_type": vg("quantity_type", ""),
+                "interest_rate": vg("interest_rate_raw", ""),
+                "maturity_date": vg("maturity_date", ""),
+                "section_path": section_str,
+                "row_text": str(vg("row_text", ""))[:100],
+            }
+            holdings.append(holding)
+        elif row_type == "SUBTOTAL":
+            label = vg("label", "")
+            if isinstance(label, dict):
+                label = label.get("value", str(label))
+            
+            subtotal = {
+                "file": stem,
+                "label": str(label),
+                "section_path": section_str,
+            }
+            subtotals.append(subtotal)
+    
+    return partial
 
 
 def main():
@@ -74,106 +203,82 @@ def main():
     
     files = list(extract_dir.glob("*.json"))
     
-    # Collect all holdings
-    all_holdings = []
+    # Holdings are streamed straight to CSV; only the first few are kept
+    # in memory for the sample printout.
+    csv_path = output_dir / "all_holdings.csv"
+    sample_holdings = []
     all_subtotals = []
     files_with_data = []
     files_without_data = []
     split_jobs = []
     
-    field_usage = Counter()
-    row_type_counts = Counter()
-    section_paths = Counter()
+    # Plain defaultdicts are cheaper to increment than Counter in the per-row
+    # loop; they are ranked with heapq.nlargest/sorted only for the report.
+    field_usage = defaultdict(int)
+    row_type_counts = defaultdict(int)
+    section_paths = defaultdict(int)
     
-    for f in files:
-        data = load_json(f)
-        if not data:
-            continue
+    # Running tallies, accumulated once per holding while merging
+    quality = defaultdict(int)
+    total_fv = 0.0
+    fv_min = None
+    fv_max = None
+    
+    # Parse files in parallel; each worker returns partial aggregates that
+    # are merged here in file order.
+    with open(csv_path, "w", newline="", encoding="utf-8") as csv_file, \
+            ProcessPoolExecutor() as executor:
+        writer = csv.DictWriter(csv_file, fieldnames=HOLDING_FIELDS)
+        writer.writeheader()
         
-        stem = f.stem.replace("_extract_response", "")
+        partials = executor.map(process_one, files, chunksize=8)
         
-        # Check for split job
-        result = data.get("result", {})
-        if isinstance(result, dict):
-            inner = result.get("result", result)
-            if isinstance(inner, dict) and "splits" in inner:
+        for partial in partials:
+            status = partial["status"]
+            stem = partial["stem"]
+            if status is None:
+                continue
+            if status == "split":
                 split_jobs.append(stem)
                 continue
-        
-        soi_rows = extract_soi_rows(data)
-        
-        if not soi_rows:
-            files_without_data.append(stem)
-            continue
-        
-        files_with_data.append(stem)
-        
-        for row in soi_rows:
-            val = get_row_value(row)
-            
-            # Track field usage
-            for k in val.keys():
-                field_usage[k] += 1
+            if status == "empty":
+                files_without_data.append(stem)
+                continue
             
-            row_type = val.get("row_type", "UNKNOWN")
-            if isinstance(row_type, dict):
-                row_type = row_type.get("value", "UNKNOWN")
-            row_type = str(row_type)
-            row_type_counts[row_type] += 1
+            files_with_data.append(stem)
             
-            # Track section paths
-            section_path = val.get("section_path", [])
-            if section_path and isinstance(section_path, list):
-                # Handle nested dict structures
-                path_strs = []
-                for item in section_path[:2]:
-                    if isinstance(item, dict):
-                        path_strs.append(str(item.get("value", item)))
-                    else:
-                        path_strs.append(str(item))
-                if path_strs:
-                    section_paths[" > ".join(path_strs)] += 1
+            for k, v in partial["field_usage"].items():
+                field_usage[k] += v
+            for k, v in partial["row_type_counts"].items():
+                row_type_counts[k] += v
+            for k, v in partial["section_paths"].items():
+                section_paths[k] += v
             
-            def get_section_str(sp):
-                """Convert section_path to string."""
-                if not sp or not isinstance(sp, list):
-                    return ""
-                parts = []
-                for item in sp:
-                    if isinstance(item, dict):
-                        parts.append(str(item.get("value", item)))
-                    else:
-                        parts.append(str(item))
-                return " > ".join(parts)
+            all_subtotals.extend(partial["subtotals"])
             
-            if row_type == "HOLDING":
-                investment = val.get("investment", val.get("label", ""))
-                if isinstance(investment, dict):
-                    investment = investment.get("value", str(investment))
-                
-                holding = {
-                    "file": stem,
-                    "investment": str(investment)[:200] if investment else "",
-                    "fair_value": parse_number(val.get("fair_value_raw")),
-                    "quantity": parse_number(val.get("quantity_raw")),
-                    "quantity_type": val.get("quantity_type", ""),
-                    "interest_rate": val.get("interest_rate_raw", ""),
-                    "maturity_date": val.get("maturity_date", ""),
-                    "section_path": get_section_str(val.get("section_path")),
-                    "row_text": str(val.get("row_text", ""))[:100],
-                }
-                all_holdings.append(holding)
-            elif row_type == "SUBTOTAL":
-                label = val.get("label", "")
-                if isinstance(label, dict):
-                    label = label.get("value", str(label))
+            for holding in partial["holdings"]:
+                writer.writerow(holding)
+                if len(sample_holdings) < 5:
+                    sample_holdings.append(holding)
                 
-                subtotal = {
-                    "file": stem,
-                    "label": str(label),
-                    "section_path": get_section_str(val.get("section_path")),
-                }
-                all_subtotals.append(subtotal)
+                quality["total_holdings"] += 1
+                fv = holding["fair_value"]
+                # $0 is a real fair value, so count anything that parsed
+                if fv is not None:
+                    quality["with_fair_value"] += 1
+                    total_fv += fv
+                    if fv_min is None or fv < fv_min:
+                        fv_min = fv
+                    if fv_max is None or fv > fv_max:
+                        fv_max = fv
+                if holding["quantity"]:
+                    quality["with_quantity"] += 1
+                if holding["interest_rate"]:
+                    quality["with_interest_rate"] += 1
+                if holding["maturity_date"]:
+                    quality["with_maturity_date"] += 1
+                if holding["section_path"]:
+                    quality["with_section_path"] += 1
     
     print(f"Files analyzed: {len(files)}")
     print(f"  Extract jobs with holdings: {len(files_with_data)}")
@@ -187,17 +292,17 @@ def main():
     print("=" * 70)
     print()
     
-    print(f"Total HOLDING rows: {len(all_holdings):,}")
+    print(f"Total HOLDING rows: {quality['total_holdings']:,}")
     print(f"Total SUBTOTAL rows: {len(all_subtotals):,}")
     print()
     
     print("Row Types Found:")
-    for row_type, count in row_type_counts.most_common():
+    for row_type, count in sorted(row_type_counts.items(), key=itemgetter(1), reverse=True):
         print(f"  {row_type}: {count:,}")
     print()
     
     print("Fields Available in Holdings:")
-    for field, count in field_usage.most_common(20):
+    for field, count in heapq.nlargest(20, field_usage.items(), key=itemgetter(1)):
         print(f"  {field}: {count:,}")
     print()
     
@@ -207,17 +312,15 @@ def main():
     print("=" * 70)
     print()
     
-    holdings_with_fv = [h for h in all_holdings if h["fair_value"] is not None]
-    if holdings_with_fv:
-        fair_values = [h["fair_value"] for h in holdings_with_fv]
-        total_fv = sum(fair_values)
-        avg_fv = total_fv / len(fair_values)
+    fv_count = quality["with_fair_value"]
+    if fv_count:
+        avg_fv = total_fv / fv_count
         
-        print(f"Holdings with fair value: {len(holdings_with_fv):,}")
+        print(f"Holdings with fair value: {fv_count:,}")
         print(f"Total fair value: ${total_fv:,.0f}")
         print(f"Average fair value: ${avg_fv:,.0f}")
-        print(f"Min fair value: ${min(fair_values):,.0f}")
-        print(f"Max fair value: ${max(fair_values):,.0f}")
+        print(f"Min fair value: ${fv_min:,.0f}")
+        print(f"Max fair value: ${fv_max:,.0f}")
     else:
         print("No holdings with parseable fair values found.")
     print()
@@ -228,7 +331,9 @@ def main():
     print("=" * 70)
     print()
     
-    for section, count in section_paths.most_common(20):
+    # Rank once and reuse: top 20 printed here, top 30 go into the summary
+    top_sections = heapq.nlargest(30, section_paths.items(), key=itemgetter(1))
+    for section, count in top_sections[:20]:
         print(f"  {section}: {count:,} holdings")
     print()
     
@@ -239,12 +344,15 @@ def main():
     print()
     
     quality = {
-        "total_holdings": len(all_holdings),
-        "with_fair_value": len([h for h in all_holdings if h["fair_value"]]),
-        "with_quantity": len([h for h in all_holdings if h["quantity"]]),
-        "with_interest_rate": len([h for h in all_holdings if h["interest_rate"]]),
-        "with_maturity_date": len([h for h in all_holdings if h["maturity_date"]]),
-        "with_section_path": len([h for h in all_holdings if h["section_path"]]),
+        field: quality[field]
+        for field in (
+            "total_holdings",
+            "with_fair_value",
+            "with_quantity",
+            "with_interest_rate",
+            "with_maturity_date",
+            "with_section_path",
+        )
     }
     
     print(f"{'Field':<25} {'Count':>10} {'Coverage':>12}")
@@ -263,13 +371,10 @@ def main():
     print()
     
     # Export all holdings to CSV
-    csv_path = output_dir / "all_holdings.csv"
-    if all_holdings:
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=all_holdings[0].keys())
-            writer.writeheader()
-            writer.writerows(all_holdings)
-        print(f"Exported {len(all_holdings):,} holdings to: {csv_path}")
+    if quality["total_holdings"]:
+        print(f"Exported {quality['total_holdings']:,} holdings to: {csv_path}")
+    else:
+        csv_path.unlink()
     
     # Export summary JSON
     summary = {
@@ -278,12 +383,12 @@ def main():
         "files_with_data": len(files_with_data),
         "files_without_data": len(files_without_data),
         "split_jobs": len(split_jobs),
-        "total_holdings": len(all_holdings),
+        "total_holdings": quality["total_holdings"],
         "total_subtotals": len(all_subtotals),
-        "total_fair_value": sum(h["fair_value"] for h in all_holdings if h["fair_value"]) if all_holdings else 0,
-        "row_types": dict(row_type_counts),
-        "top_sections": dict(section_paths.most_common(30)),
-        "field_usage": dict(field_usage),
+        "total_fair_value": total_fv if quality["total_holdings"] else 0,
+        "row_types": {k: v for k, v in row_type_counts.items()},
+        "top_sections": {k: v for k, v in top_sections},
+        "field_usage": {k: v for k, v in field_usage.items()},
         "quality": quality,
         "success_rate": len(files_with_data) / (len(files_with_data) + len(files_without_data)) * 100 if (files_with_data or files_without_data) else 0
     }
@@ -300,7 +405,7 @@ def main():
     print("=" * 70)
     print()
     
-    for h in all_holdings[:5]:
+    for h in sample_holdings:
         print(f"Investment: {h['investment'][:60]}...")
         print(f"  Fair Value: ${h['fair_value']:,.0f}" if h['fair_value'] else "  Fair Value: N/A")
         print(f"  Section: {h['section_path']}")
@@ -313,7 +418,6 @@ def main():
     print("=" * 70)
     print()
     
-    total_fv = sum(h['fair_value'] for h in all_holdings if h['fair_value'])
     pct_fv = quality['with_fair_value']/quality['total_holdings']*100 if quality['total_holdings'] else 0
     pct_qty = quality['with_quantity']/quality['total_holdings']*100 if quality['total_holdings'] else 0
     pct_sec = quality['with_section_path']/quality['total_holdings']*100 if quality['total_holdings'] else 0
@@ -323,7 +427,7 @@ YOUR $930 INVESTMENT RESULTS:
 =============================
 
 [+] SUCCESSFULLY EXTRACTED:
-  - {len(all_holdings):,} individual investment holdings
+  - {quality['total_holdings']:,} individual investment holdings
   - {len(all_subtotals):,} subtotal/category rows
   - ${total_fv:,.0f} in total fair value tracked
   - From {len(files_with_data)} documents
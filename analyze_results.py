@@ -5,11 +5,14 @@ Separates extract jobs from split jobs and provides insights.
 Run: python analyze_results.py
 """
 
-import json
+import shutil
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import orjson
+
 
 def classify_result(data: dict) -> str:
     """Classify what type of job result this is."""
@@ -51,6 +54,40 @@ def count_soi_rows(data: dict) -> int:
     return 0
 
 
+def classify_file(path: Path) -> tuple:
+    """
+    Load and classify a single result file.
+
+    Returns (stem, job_type, row_count, soi_state), where soi_state is
+    "null" or "empty" for extract jobs without rows. Runs in a worker
+    process, so it returns plain picklable data.
+
+    Every file is parsed in full: main() moves split results and deletes
+    parse results based on this, and only classify_result on the whole
+    document is reliable (citations and nested "blocks"/"splits" keys can
+    appear anywhere before result.soi_rows).
+    """
+    stem = path.stem.replace("_extract_response", "")
+    try:
+        data = orjson.loads(path.read_bytes())
+        
+        job_type = classify_result(data)
+        row_count = 0
+        soi_state = None
+        
+        if job_type == "extract":
+            row_count = count_soi_rows(data)
+            if row_count == 0:
+                # Check if null or empty list
+                result = data.get("result", {})
+                soi_rows = result.get("soi_rows")
+                soi_state = "null" if soi_rows is None else "empty"
+        
+        return stem, job_type, row_count, soi_state
+    except Exception:
+        return stem, "unknown", 0, None
+
+
 def main():
     extract_urls_dir = Path("extract_urls")
     
@@ -77,29 +114,18 @@ def main():
         "null_rows": [],
     }
     
-    for f in files:
-        try:
-            with open(f, "r") as fp:
-                data = json.load(fp)
-            
-            job_type = classify_result(data)
-            by_type[job_type].append(f.stem)
+    # Classify files in parallel; results come back in file order
+    with ProcessPoolExecutor() as executor:
+        for stem, job_type, row_count, soi_state in executor.map(classify_file, files, chunksize=8):
+            by_type[job_type].append(stem)
             
             if job_type == "extract":
-                row_count = count_soi_rows(data)
                 if row_count > 0:
-                    extract_stats["with_rows"].append((f.stem, row_count))
+                    extract_stats["with_rows"].append((stem, row_count))
+                elif soi_state == "null":
+                    extract_stats["null_rows"].append(stem)
                 else:
-                    # Check if null or empty list
-                    result = data.get("result", {})
-                    soi_rows = result.get("soi_rows")
-                    if soi_rows is None:
-                        extract_stats["null_rows"].append(f.stem)
-                    else:
-                        extract_stats["empty_rows"].append(f.stem)
-                        
-        except Exception as e:
-            by_type["unknown"].append(f.stem)
+                    extract_stats["empty_rows"].append(stem)
     
     # Report
     print("JOB TYPES:")
@@ -139,12 +165,12 @@ def main():
         dst = split_dir / f"{stem}_split_result.json"
         
         if src.exists() and not dst.exists():
-            # Read, rename, and move
-            with open(src, "r") as f:
-                data = json.load(f)
-            with open(dst, "w") as f:
-                json.dump(data, f, indent=2)
-            src.unlink()  # Remove from extract_urls
+            # Content is unchanged, so move the file rather than re-serialize it
+            try:
+                src.rename(dst)
+            except OSError:
+                # e.g. split_results/ on a different filesystem
+                shutil.move(str(src), str(dst))
             moved += 1
     
     print(f"  Moved {moved} split results to split_results/")
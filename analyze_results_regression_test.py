@@ -0,0 +1,58 @@
+"""
+Regression test for analyze_results file classification.
+
+analyze_results.main() moves files classified as "split" and deletes files
+classified as "parse", so an extract response must never be classified as
+either just because "splits"/"blocks" keys appear early in the file.
+
+Run: python -m pytest analyze_results_regression_test.py
+"""
+
+import orjson
+
+from analyze_results import classify_file, classify_result
+
+
+def _citation(i):
+    return {"type": "Text", "bbox": {"left": 0.1, "top": 0.2, "page": i}, "blocks": [], "content": "x" * 40}
+
+
+def test_extract_with_early_nested_blocks_is_extract(tmp_path):
+    """Citations with nested "blocks" keys before soi_rows, well past 8 KB."""
+    data = {
+        "citations": [_citation(i) for i in range(100)],
+        "result": {"soi_rows": [{"row_type": {"value": "HOLDING"}}]},
+    }
+    payload = orjson.dumps(data)
+    assert payload.index(b'"soi_rows"') > 8192
+
+    path = tmp_path / "x_extract_response.json"
+    path.write_bytes(payload)
+
+    assert classify_result(data) == "extract"
+    assert classify_file(path) == ("x", "extract", 1, None)
+
+
+def test_extract_with_early_splits_key_is_extract(tmp_path):
+    """A "splits" key nested ahead of result.result.soi_rows."""
+    data = {
+        "usage": {"splits": [{"name": "soi", "pages": list(range(2000))}]},
+        "result": {"result": {"soi_rows": [{"row_type": {"value": "TOTAL"}}] * 3}},
+    }
+    payload = orjson.dumps(data)
+    assert payload.index(b'"soi_rows"') > 8192
+
+    path = tmp_path / "y_extract_response.json"
+    path.write_bytes(payload)
+
+    assert classify_file(path) == ("y", "extract", 3, None)
+
+
+def test_split_and_parse_results(tmp_path):
+    split_path = tmp_path / "s_extract_response.json"
+    split_path.write_bytes(orjson.dumps({"result": {"result": {"splits": []}}}))
+    parse_path = tmp_path / "p_extract_response.json"
+    parse_path.write_bytes(orjson.dumps({"result": {"blocks": []}}))
+
+    assert classify_file(split_path) == ("s", "split", 0, None)
+    assert classify_file(parse_path) == ("p", "parse", 0, None)
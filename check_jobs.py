@@ -4,39 +4,59 @@ Run: python check_jobs.py
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 from reducto import Reducto
 
 load_dotenv()
 
-def main():
-    api_key = os.environ.get("REDUCTO_API_KEY")
-    if not api_key:
-        print("ERROR: REDUCTO_API_KEY not found in environment")
-        return
-    
-    client = Reducto(api_key=api_key)
-    
-    print("Fetching all jobs from Reducto...")
-    print()
-    
-    # Get all jobs with pagination
+# Jobs requested per get_all page
+JOB_PAGE_LIMIT = 100
+
+# Concurrent cancel requests
+CANCEL_WORKERS = 16
+
+
+def fetch_all_jobs(client: Reducto) -> list:
+    """Paginate through all jobs, keeping only job_id and status."""
     cursor = None
     all_jobs = []
     
     while True:
         if cursor:
-            response = client.job.get_all(limit=100, cursor=cursor, exclude_configs=True)
+            response = client.job.get_all(limit=JOB_PAGE_LIMIT, cursor=cursor, exclude_configs=True)
         else:
-            response = client.job.get_all(limit=100, exclude_configs=True)
+            response = client.job.get_all(limit=JOB_PAGE_LIMIT, exclude_configs=True)
         
-        all_jobs.extend(response.jobs)
+        for job in response.jobs:
+            all_jobs.append({
+                "job_id": getattr(job, 'job_id', None) or getattr(job, 'id', None),
+                "status": getattr(job, 'status', 'unknown'),
+            })
         
         if response.next_cursor:
             cursor = response.next_cursor
         else:
             break
     
+    return all_jobs
+
+
+def main():
+    api_key = os.environ.get("REDUCTO_API_KEY")
+    if not api_key:
+        print("ERROR: REDUCTO_API_KEY not found in environment")
+        return
+    
+    client = Reducto(api_key=api_key)
+    
+    # Always fetch a fresh list: cancelling from a stale snapshot would miss
+    # jobs submitted since
+    print("Fetching all jobs from Reducto...")
+    print()
+    all_jobs = fetch_all_jobs(client)
+    
     print(f"Found {len(all_jobs)} total jobs")
     print()
     
@@ -48,7 +68,7 @@ def main():
     other = []
     
     for job in all_jobs:
-        status = getattr(job, 'status', 'unknown').lower()
+        status = str(job["status"]).lower()
         if status == 'pending':
             pending.append(job)
         elif status in ['running', 'processing', 'inprogress', 'completing']:
@@ -79,20 +99,30 @@ def main():
     
     cancelled = 0
     errors = 0
+    job_ids = []
     
     for job in jobs_to_cancel:
-        job_id = getattr(job, 'job_id', None) or getattr(job, 'id', None)
-        if not job_id:
+        if not job["job_id"]:
             print(f"  [SKIP] Could not get job ID")
             continue
-        
+        job_ids.append(job["job_id"])
+    
+    def cancel(job_id):
         try:
             client.job.cancel(job_id)
-            print(f"  [CANCELLED] {job_id}")
-            cancelled += 1
+            return job_id, None
         except Exception as e:
-            print(f"  [ERROR] {job_id}: {e}")
-            errors += 1
+            return job_id, e
+    
+    # Cancel requests are independent HTTP calls, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=CANCEL_WORKERS) as executor:
+        for job_id, error in executor.map(cancel, job_ids):
+            if error is None:
+                print(f"  [CANCELLED] {job_id}")
+                cancelled += 1
+            else:
+                print(f"  [ERROR] {job_id}: {error}")
+                errors += 1
     
     print()
     print(f"Done. Cancelled: {cancelled}, Errors: {errors}")
@@ -14,9 +14,15 @@ Usage examples:
     # Custom output directory, overwrite existing PDFs
     python convert_html_to_pdf.py --input-dir txt/html_txt --output-dir my_pdfs --overwrite
 
+    # HTML that loads remote resources: wait for the network to go idle
+    python convert_html_to_pdf.py --input-dir txt/html_txt --wait-until networkidle
+
     # For very large HTML files, increase timeout
     python convert_html_to_pdf.py --input-dir txt/html_txt --timeout-ms 120000
 
+    # Render more pages at once (one Chromium tab per in-flight file)
+    python convert_html_to_pdf.py --input-dir txt/html_txt --concurrency 16
+
 PDF settings:
     - Uses browser default page size (typically US Letter portrait)
     - Honors CSS @page rules if present in the HTML (prefer_css_page_size=True)
@@ -26,11 +32,15 @@ PDF settings:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Optional
 
 try:
-    from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 except ImportError as e:
     raise SystemExit(
         "Playwright is required.\n\n"
@@ -40,92 +50,244 @@ except ImportError as e:
     ) from e
 
 
+# Threads writing finished PDF bytes to disk
+PDF_WRITE_WORKERS = 4
+
+# Renders per pooled page before it is closed and replaced
+PAGE_MAX_USES = 100
+
+
 # =============================================================================
 # PDF Rendering
 # =============================================================================
 
 class HtmlPdfRenderer:
-    """Context manager for Playwright-based HTML→PDF rendering."""
+    """
+    Async context manager for Playwright-based HTML→PDF rendering.
+
+    A single browser context is shared and at most max_pages renders run at
+    once. Pages are pooled and reused across files rather than opened and
+    closed per file; each is recycled after PAGE_MAX_USES renders to bound
+    renderer memory growth.
+    """
 
-    def __init__(self, *, timeout_ms: int = 60000) -> None:
+    def __init__(self, *, timeout_ms: int = 60000, wait_until: str = "load", max_pages: int = 8) -> None:
         self._timeout_ms = timeout_ms
+        self._wait_until = wait_until
+        self._page_slots = asyncio.Semaphore(max_pages)
+        # Idle pages as (page, times used); at most max_pages exist at once
+        self._idle_pages: list[tuple[Page, int]] = []
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
 
-    def __enter__(self) -> "HtmlPdfRenderer":
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch()
-        self._context = self._browser.new_context()
+    async def __aenter__(self) -> "HtmlPdfRenderer":
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self._context = await self._browser.new_context()
         return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        for page, _ in self._idle_pages:
+            await page.close()
+        self._idle_pages.clear()
         if self._context:
-            self._context.close()
+            await self._context.close()
         if self._browser:
-            self._browser.close()
+            await self._browser.close()
         if self._playwright:
-            self._playwright.stop()
+            await self._playwright.stop()
 
-    def render(self, html_path: Path, output_pdf: Path) -> None:
+    async def render(self, html_path: Path) -> bytes:
         """
-        Render an HTML file to PDF.
+        Render an HTML file and return the PDF bytes.
 
         Navigates to the file:// URL so relative resources (CSS, images) resolve,
-        then prints to PDF with browser-like defaults.
+        then prints to PDF with browser-like defaults. Writing the bytes is left
+        to the caller so the page is free for the next file as soon as Chromium
+        has produced them.
         """
-        output_pdf.parent.mkdir(parents=True, exist_ok=True)
         if self._context is None:
             raise RuntimeError("HtmlPdfRenderer not started")
 
-        page: Page = self._context.new_page()
-        try:
-            # Navigate to file:// URL so relative paths resolve correctly
-            file_url = html_path.resolve().as_uri()
-            page.goto(file_url, wait_until="networkidle", timeout=self._timeout_ms)
-
-            # Generate PDF with browser-like print defaults
-            # - No explicit width/height: uses browser default (Letter)
-            # - prefer_css_page_size=True: honors CSS @page rules if present
-            # - print_background=True: includes background colors/images
-            page.pdf(
-                path=str(output_pdf),
-                print_background=True,
-                prefer_css_page_size=True,
-                timeout=self._timeout_ms,
-            )
-        finally:
-            page.close()
+        async with self._page_slots:
+            if self._idle_pages:
+                page, uses = self._idle_pages.pop()
+            else:
+                page, uses = await self._context.new_page(), 0
+            reusable = False
+            try:
+                # Navigate to file:// URL so relative paths resolve correctly.
+                # Paths from main() are already absolute, so skip resolve()'s
+                # per-component stat calls.
+                if html_path.is_absolute():
+                    file_url = html_path.as_uri()
+                else:
+                    file_url = html_path.resolve().as_uri()
+                # "load" is enough for local files: it waits for CSS/images
+                # without networkidle's extra 500ms idle window.
+                await page.goto(file_url, wait_until=self._wait_until, timeout=self._timeout_ms)
+                # Webfonts may still be loading after the load event
+                await page.evaluate("document.fonts.ready")
+
+                # Generate PDF with browser-like print defaults
+                # - No explicit width/height: uses browser default (Letter)
+                # - prefer_css_page_size=True: honors CSS @page rules if present
+                # - print_background=True: includes background colors/images
+                pdf_bytes = await page.pdf(
+                    print_background=True,
+                    prefer_css_page_size=True,
+                    timeout=self._timeout_ms,
+                )
+                # Drop the document before the page goes back to the pool
+                await page.goto("about:blank")
+                reusable = True
+                return pdf_bytes
+            finally:
+                uses += 1
+                if reusable and uses < PAGE_MAX_USES:
+                    self._idle_pages.append((page, uses))
+                else:
+                    # Failed renders may leave the page in a bad state
+                    await page.close()
 
 
 # =============================================================================
 # File Processing
 # =============================================================================
 
-def convert_one(
+async def convert_one(
     html_path: Path,
     *,
-    input_dir: Path,
+    rel: str,
     output_dir: Path,
     overwrite: bool,
     renderer: HtmlPdfRenderer,
+    write_pool: ThreadPoolExecutor,
+    created_dirs: set,
 ) -> Optional[Path]:
-    """Convert a single HTML file to PDF."""
-    rel = html_path.relative_to(input_dir)
+    """
+    Convert a single HTML file to PDF.
+
+    rel is html_path relative to the input directory. The PDF bytes are
+    written on write_pool so disk I/O overlaps with rendering of other files.
+    created_dirs records output directories already created, so each is only
+    mkdir'd once.
+    """
     output_pdf = (output_dir / rel).with_suffix(".pdf")
 
     if output_pdf.exists() and not overwrite:
         return None
 
-    renderer.render(html_path, output_pdf)
+    out_parent = output_pdf.parent
+    if out_parent not in created_dirs:
+        out_parent.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(out_parent)
+
+    pdf_bytes = await renderer.render(html_path)
+    await asyncio.get_running_loop().run_in_executor(write_pool, output_pdf.write_bytes, pdf_bytes)
     return output_pdf
 
 
-def iter_input_files(input_dir: Path, pattern: str, recursive: bool) -> Iterable[Path]:
-    """Iterate over input files matching the pattern."""
-    if recursive:
-        return sorted(input_dir.rglob(pattern))
-    return sorted(input_dir.glob(pattern))
+def iter_input_files(input_dir: Path, pattern: str, recursive: bool) -> list[Path]:
+    """
+    Return the regular files matching the pattern, sorted.
+    
+    Walks the tree with os.scandir, so whether an entry is a file or a
+    directory comes from the directory listing instead of a stat() per path.
+    Like rglob, symlinked directories are not descended into. Patterns that
+    span directories fall back to glob/rglob.
+    """
+    if "/" in pattern or os.sep in pattern:
+        paths = input_dir.rglob(pattern) if recursive else input_dir.glob(pattern)
+        return sorted(p for p in paths if p.is_file())
+    
+    files: list[Path] = []
+    pending = [str(input_dir)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Like rglob, skip directories that can't be listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                    files.append(Path(entry.path))
+    files.sort()
+    return files
+
+
+async def convert_all(
+    files: list[Path],
+    *,
+    input_dir: Path,
+    output_dir: Path,
+    args: argparse.Namespace,
+) -> dict:
+    """
+    Convert files concurrently, rendering at most args.concurrency at a time.
+
+    Progress lines are printed as each file finishes, so they may appear out
+    of input order. Returns converted/skipped/errors counts.
+    """
+    counts = {"converted": 0, "skipped": 0, "errors": 0}
+    total = len(files)
+    created_dirs: set = set()
+
+    # Files come from input_dir.glob/rglob on the resolved input_dir, so they
+    # all share its string prefix; slicing is cheaper than relative_to().
+    input_root = os.path.join(str(input_dir), "")
+    root_len = len(input_root)
+
+    renderer = HtmlPdfRenderer(
+        timeout_ms=args.timeout_ms,
+        wait_until=args.wait_until,
+        max_pages=args.concurrency,
+    )
+    with ThreadPoolExecutor(max_workers=PDF_WRITE_WORKERS) as write_pool:
+        async with renderer:
+
+            async def _one(i: int, path: Path) -> None:
+                rel = str(path)[root_len:]
+                try:
+                    out = await convert_one(
+                        path,
+                        rel=rel,
+                        output_dir=output_dir,
+                        overwrite=args.overwrite,
+                        renderer=renderer,
+                        write_pool=write_pool,
+                        created_dirs=created_dirs,
+                    )
+                    if out is None:
+                        counts["skipped"] += 1
+                        print(f"[{i}/{total}] SKIP {rel} (exists)")
+                    else:
+                        counts["converted"] += 1
+                        print(f"[{i}/{total}] OK   {rel}")
+                except Exception as e:
+                    counts["errors"] += 1
+                    print(f"[{i}/{total}] ERR  {rel}: {e}")
+                    if args.fail_fast:
+                        raise
+
+            # With --fail-fast the first error propagates out of gather(). The
+            # other renders are cancelled and awaited before the renderer is
+            # torn down, so they don't fail with "Target closed" on top of it.
+            tasks = [asyncio.create_task(_one(i, path)) for i, path in enumerate(files, start=1)]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+    return counts
 
 
 # =============================================================================
@@ -191,13 +353,33 @@ def main() -> int:
         default=60000,
         help="Timeout in milliseconds for page navigation and PDF generation (increase for very large files).",
     )
+    parser.add_argument(
+        "--wait-until",
+        choices=["load", "domcontentloaded", "networkidle"],
+        default="load",
+        help="Navigation event to wait for before printing (networkidle adds a 500ms idle wait per file).",
+    )
+
+    # Concurrency
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of files rendered at once (one browser page each).",
+    )
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     input_dir = args.input_dir.resolve()
     output_dir = (args.output_dir or (input_dir / "pdf_out")).resolve()
 
-    files = [p for p in iter_input_files(input_dir, args.glob_pattern, args.recursive) if p.is_file()]
+    if not input_dir.is_dir():
+        print(f"Error: Input directory does not exist: {input_dir}")
+        return 1
+
+    files = iter_input_files(input_dir, args.glob_pattern, args.recursive)
     if not files:
         print(f"No files matched '{args.glob_pattern}' under {input_dir}")
         return 1
@@ -205,35 +387,13 @@ def main() -> int:
     print(f"Input:     {input_dir}")
     print(f"Output:    {output_dir}")
     print(f"Files:     {len(files)} (recursive={args.recursive}, glob={args.glob_pattern})")
-    print(f"Timeout:   {args.timeout_ms}ms")
+    print(f"Timeout:   {args.timeout_ms}ms (wait_until={args.wait_until})")
+    print(f"Pages:     {args.concurrency} concurrent")
     print(f"Overwrite: {args.overwrite}")
     print()
 
-    converted = 0
-    skipped = 0
-    errors = 0
-
-    with HtmlPdfRenderer(timeout_ms=args.timeout_ms) as renderer:
-        for i, path in enumerate(files, start=1):
-            try:
-                out = convert_one(
-                    path,
-                    input_dir=input_dir,
-                    output_dir=output_dir,
-                    overwrite=args.overwrite,
-                    renderer=renderer,
-                )
-                if out is None:
-                    skipped += 1
-                    print(f"[{i}/{len(files)}] SKIP {path.relative_to(input_dir)} (exists)")
-                else:
-                    converted += 1
-                    print(f"[{i}/{len(files)}] OK   {path.relative_to(input_dir)}")
-            except Exception as e:
-                errors += 1
-                print(f"[{i}/{len(files)}] ERR  {path.relative_to(input_dir)}: {e}")
-                if args.fail_fast:
-                    raise
+    counts = asyncio.run(convert_all(files, input_dir=input_dir, output_dir=output_dir, args=args))
+    converted, skipped, errors = counts["converted"], counts["skipped"], counts["errors"]
 
     print()
     print(f"Done. converted={converted} skipped={skipped} errors={errors}")
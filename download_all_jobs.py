@@ -6,14 +6,18 @@ Run: python download_all_jobs.py
 """
 
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+import orjson
 from dotenv import load_dotenv
 from reducto import Reducto
 
 load_dotenv()
 
+# Concurrent job-detail requests
+DOWNLOAD_WORKERS = 16
+
 
 def main():
     api_key = os.environ.get("REDUCTO_API_KEY")
@@ -59,8 +63,11 @@ def main():
     print(f"Found {len(completed_jobs)} completed jobs")
     print()
     
-    # Check which ones we already have
-    existing_files = set(f.stem.replace("_extract_response", "") for f in extract_urls_dir.glob("*_extract_response.json"))
+    # Check which ones we already have, using plain name checks on the
+    # directory listing rather than Path objects
+    suffix = "_extract_response.json"
+    with os.scandir(extract_urls_dir) as entries:
+        existing_files = {e.name[:-len(suffix)] for e in entries if e.name.endswith(suffix)}
     print(f"Already have {len(existing_files)} extract responses on disk")
     
     # Download results
@@ -68,6 +75,10 @@ def main():
     skipped = 0
     errors = 0
     
+    # Jobs that share a stem write the same file, so they are kept together
+    # and handled in order by one worker
+    jobs_by_stem = {}
+    
     for i, job in enumerate(completed_jobs, 1):
         job_id = getattr(job, 'job_id', None) or getattr(job, 'id', None)
         if not job_id:
@@ -93,52 +104,75 @@ def main():
         else:
             stem = job_id
         
-        # Skip if already exists
+        jobs_by_stem.setdefault(stem, []).append((i, job_id))
+    
+    def download(stem, jobs):
+        """Download the jobs for one stem, returning (i, outcome, message) for each."""
         output_file = extract_urls_dir / f"{stem}_extract_response.json"
-        if output_file.exists():
-            skipped += 1
-            continue
+        outcomes = []
         
-        # Get full job details including result
-        try:
-            job_detail = client.job.get(job_id)
+        for i, job_id in jobs:
+            # Skip if already exists
+            if output_file.exists():
+                outcomes.append((i, "skipped", None))
+                continue
             
-            if hasattr(job_detail, 'result') and job_detail.result:
-                result = job_detail.result
-                if hasattr(result, 'model_dump'):
-                    result_data = result.model_dump(mode='json')
-                elif isinstance(result, dict):
-                    result_data = result
-                else:
-                    result_data = {"raw": str(result)}
-                
-                # Build response structure
-                response_data = {
-                    "result": result_data,
-                    "job_id": job_id,
-                    "status": getattr(job_detail, 'status', 'unknown'),
-                }
-                
-                # Add usage if available
-                if hasattr(job_detail, 'usage'):
-                    usage = job_detail.usage
-                    if hasattr(usage, 'model_dump'):
-                        response_data["usage"] = usage.model_dump(mode='json')
-                    elif isinstance(usage, dict):
-                        response_data["usage"] = usage
+            # Get full job details including result
+            try:
+                job_detail = client.job.get(job_id)
                 
-                with open(output_file, "w") as f:
-                    json.dump(response_data, f, indent=2, default=str)
-                
-                downloaded += 1
-                print(f"[{i}/{len(completed_jobs)}] Downloaded: {stem}")
-            else:
-                print(f"[{i}/{len(completed_jobs)}] No result: {job_id}")
-                errors += 1
-                
-        except Exception as e:
-            print(f"[{i}/{len(completed_jobs)}] Error {job_id}: {e}")
-            errors += 1
+                if hasattr(job_detail, 'result') and job_detail.result:
+                    result = job_detail.result
+                    if hasattr(result, 'model_dump'):
+                        result_data = result.model_dump(mode='json')
+                    elif isinstance(result, dict):
+                        result_data = result
+                    else:
+                        result_data = {"raw": str(result)}
+                    
+                    # Build response structure
+                    response_data = {
+                        "result": result_data,
+                        "job_id": job_id,
+                        "status": getattr(job_detail, 'status', 'unknown'),
+                    }
+                    
+                    # Add usage if available
+                    if hasattr(job_detail, 'usage'):
+                        usage = job_detail.usage
+                        if hasattr(usage, 'model_dump'):
+                            response_data["usage"] = usage.model_dump(mode='json')
+                        elif isinstance(usage, dict):
+                            response_data["usage"] = usage
+                    
+                    # Serialized in one call and written with a single write()
+                    output_file.write_bytes(orjson.dumps(
+                        response_data,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    ))
+                    
+                    outcomes.append((i, "downloaded", f"Downloaded: {stem}"))
+                else:
+                    outcomes.append((i, "error", f"No result: {job_id}"))
+                    
+            except Exception as e:
+                outcomes.append((i, "error", f"Error {job_id}: {e}"))
+        
+        return outcomes
+    
+    # Job-detail requests are independent HTTP calls, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        for outcomes in executor.map(download, jobs_by_stem.keys(), jobs_by_stem.values()):
+            for i, outcome, message in outcomes:
+                if outcome == "skipped":
+                    skipped += 1
+                    continue
+                if outcome == "downloaded":
+                    downloaded += 1
+                else:
+                    errors += 1
+                print(f"[{i}/{len(completed_jobs)}] {message}")
     
     print()
     print("=" * 60)
@@ -7,63 +7,78 @@ This script:
 3. Downloads results to a dedicated folder
 4. Validates each result
 
+Stats for every fetched result are recorded in extraction_downloads/.stats.json.
+Results with no rows are not saved, so later runs use that record to skip them
+instead of downloading them again. Delete the file to re-check them.
+
 Run: python download_extractions_only.py
 """
 
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from collections import Counter
+import orjson
 from dotenv import load_dotenv
 from reducto import Reducto
 
 load_dotenv()
 
+# Concurrent job-detail requests
+DOWNLOAD_WORKERS = 16
+
+# Stats of fetched results, kept in the output directory and keyed by job_id.
+# Completed results don't change, so the stats never go stale.
+STATS_CACHE_NAME = ".stats.json"
+
+
+def job_config(job) -> dict:
+    """
+    Return the job's config as a plain dict (empty if missing).
+    
+    model_dump() walks the whole pydantic model, so callers dump each job's
+    config once and pass the dict around.
+    """
+    config = getattr(job, 'config', None) or {}
+    if hasattr(config, 'model_dump'):
+        config = config.model_dump()
+    return config if isinstance(config, dict) else {}
+
 
-def is_extraction_job(job) -> bool:
+def is_extraction_job(job, config: dict) -> bool:
     """
     Determine if a job is an extraction job (vs split/parse/other).
     
     Extraction jobs typically have:
     - endpoint containing 'extract'
     - config with 'schema' or 'instructions'
+    
+    config is the job's config from job_config().
     """
     # Check endpoint
     endpoint = getattr(job, 'endpoint', None) or ''
     if 'extract' in str(endpoint).lower():
         return True
     
-    # Check config
-    config = getattr(job, 'config', None) or {}
-    if hasattr(config, 'model_dump'):
-        config = config.model_dump()
-    
-    if isinstance(config, dict):
-        # Extraction configs have 'instructions' with 'schema'
-        if 'instructions' in config:
-            return True
-        if 'schema' in config:
-            return True
+    # Extraction configs have 'instructions' with 'schema'
+    if 'instructions' in config:
+        return True
+    if 'schema' in config:
+        return True
     
     return False
 
 
-def is_split_job(job) -> bool:
-    """Check if this is a split/classification job."""
+def is_split_job(job, config: dict) -> bool:
+    """Check if this is a split/classification job, given its job_config()."""
     endpoint = getattr(job, 'endpoint', None) or ''
     if 'split' in str(endpoint).lower():
         return True
     
-    config = getattr(job, 'config', None) or {}
-    if hasattr(config, 'model_dump'):
-        config = config.model_dump()
-    
-    if isinstance(config, dict):
-        if 'split_rules' in config:
-            return True
-        if 'partition_strategy' in config:
-            return True
+    if 'split_rules' in config:
+        return True
+    if 'partition_strategy' in config:
+        return True
     
     return False
 
@@ -93,21 +108,36 @@ def get_extraction_stats(result_data: dict) -> dict:
     if not isinstance(soi_rows, list):
         soi_rows = []
     
-    row_types = Counter()
+    # Only three row types are reported, so count them directly
+    holdings = subtotals = totals = 0
     for row in soi_rows:
         rt = row.get('row_type')
         if isinstance(rt, dict):
-            rt = rt.get('value', 'UNKNOWN')
-        row_types[rt or 'UNKNOWN'] += 1
+            rt = rt.get('value')
+        if rt == "HOLDING":
+            holdings += 1
+        elif rt == "SUBTOTAL":
+            subtotals += 1
+        elif rt == "TOTAL":
+            totals += 1
     
     return {
         "total_rows": len(soi_rows),
-        "holdings": row_types.get("HOLDING", 0),
-        "subtotals": row_types.get("SUBTOTAL", 0),
-        "totals": row_types.get("TOTAL", 0),
+        "holdings": holdings,
+        "subtotals": subtotals,
+        "totals": totals,
     }
 
 
+def load_stats_cache(cache_path: Path) -> dict:
+    """Return the cached stats by job_id, or an empty dict if missing or unreadable."""
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
 def main():
     api_key = os.environ.get("REDUCTO_API_KEY")
     if not api_key:
@@ -146,7 +176,7 @@ def main():
     
     print()
     
-    # Categorize jobs
+    # Categorize jobs; extraction jobs are kept with their config dict
     extraction_jobs = []
     split_jobs = []
     other_jobs = []
@@ -156,15 +186,16 @@ def main():
         if status != 'completed':
             continue
         
-        if is_split_job(job):
+        config = job_config(job)
+        if is_split_job(job, config):
             split_jobs.append(job)
-        elif is_extraction_job(job):
-            extraction_jobs.append(job)
+        elif is_extraction_job(job, config):
+            extraction_jobs.append((job, config))
         else:
             # Try to identify by endpoint
             endpoint = getattr(job, 'endpoint', None) or ''
             if 'extract' in str(endpoint).lower():
-                extraction_jobs.append(job)
+                extraction_jobs.append((job, config))
             elif 'split' in str(endpoint).lower():
                 split_jobs.append(job)
             else:
@@ -178,9 +209,15 @@ def main():
     print(f"  Other jobs:      {len(other_jobs)}")
     print()
     
-    # Check existing files
-    existing_ids = set(f.stem.replace("_extract_response", "") for f in output_dir.glob("*_extract_response.json"))
+    # Check existing files, using plain name checks on the directory listing
+    # rather than Path objects
+    suffix = "_extract_response.json"
+    with os.scandir(output_dir) as entries:
+        existing_ids = {e.name[:-len(suffix)] for e in entries if e.name.endswith(suffix)}
     print(f"Already have {len(existing_ids)} files in {output_dir}/")
+    
+    stats_cache_path = output_dir / STATS_CACHE_NAME
+    stats_cache = load_stats_cache(stats_cache_path)
     print()
     
     # Download extraction results
@@ -194,19 +231,17 @@ def main():
     errors = 0
     stats_total = {"total_rows": 0, "holdings": 0, "subtotals": 0, "totals": 0}
     
-    for i, job in enumerate(extraction_jobs, 1):
+    # Jobs that share a stem write the same file, so they are kept together
+    # and handled in order by one worker
+    jobs_by_stem = {}
+    
+    for i, (job, config) in enumerate(extraction_jobs, 1):
         job_id = getattr(job, 'job_id', None) or getattr(job, 'id', None)
         if not job_id:
             continue
         
         # Get filename from config
-        config = getattr(job, 'config', None) or {}
-        if hasattr(config, 'model_dump'):
-            config = config.model_dump()
-        
-        input_url = ""
-        if isinstance(config, dict):
-            input_url = config.get('input', '') or config.get('document_url', '') or ''
+        input_url = config.get('input', '') or config.get('document_url', '') or ''
         
         if input_url and '/' in input_url:
             filename_part = input_url.split('/')[-1]
@@ -219,58 +254,90 @@ def main():
             skipped_existing += 1
             continue
         
+        # Empty results aren't saved; skip the ones already known to be empty
+        cached = stats_cache.get(job_id)
+        if cached is not None and cached["total_rows"] == 0:
+            skipped_empty += 1
+            print(f"[{i}/{len(extraction_jobs)}] EMPTY: {stem} (cached)")
+            continue
+        
+        jobs_by_stem.setdefault(stem, []).append((i, job_id))
+    
+    def download(stem, jobs):
+        """Download the jobs for one stem, returning (i, job_id, outcome, message, stats) for each."""
         output_file = output_dir / f"{stem}_extract_response.json"
+        outcomes = []
         
-        try:
-            job_detail = client.job.get(job_id)
-            
-            if hasattr(job_detail, 'result') and job_detail.result:
-                result = job_detail.result
-                if hasattr(result, 'model_dump'):
-                    result_data = result.model_dump(mode='json')
-                elif isinstance(result, dict):
-                    result_data = result
-                else:
-                    result_data = {"raw": str(result)}
+        for i, job_id in jobs:
+            try:
+                job_detail = client.job.get(job_id)
                 
-                # Get stats
-                stats = get_extraction_stats(result_data)
-                
-                # Skip empty results
-                if stats["total_rows"] == 0:
-                    skipped_empty += 1
-                    print(f"[{i}/{len(extraction_jobs)}] EMPTY: {stem}")
-                    continue
-                
-                # Build response structure
-                response_data = {
-                    "result": result_data,
-                    "job_id": job_id,
-                    "status": getattr(job_detail, 'status', 'unknown'),
-                }
-                
-                if hasattr(job_detail, 'usage'):
-                    usage = job_detail.usage
-                    if hasattr(usage, 'model_dump'):
-                        response_data["usage"] = usage.model_dump(mode='json')
-                    elif isinstance(usage, dict):
-                        response_data["usage"] = usage
-                
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(response_data, f, indent=2, default=str)
-                
-                downloaded += 1
-                for key in stats_total:
-                    stats_total[key] += stats.get(key, 0)
-                
-                print(f"[{i}/{len(extraction_jobs)}] Downloaded: {stem} ({stats['total_rows']} rows)")
-            else:
-                print(f"[{i}/{len(extraction_jobs)}] No result: {job_id}")
-                errors += 1
-                
-        except Exception as e:
-            print(f"[{i}/{len(extraction_jobs)}] Error {job_id}: {e}")
-            errors += 1
+                if hasattr(job_detail, 'result') and job_detail.result:
+                    result = job_detail.result
+                    if hasattr(result, 'model_dump'):
+                        result_data = result.model_dump(mode='json')
+                    elif isinstance(result, dict):
+                        result_data = result
+                    else:
+                        result_data = {"raw": str(result)}
+                    
+                    # Get stats
+                    stats = get_extraction_stats(result_data)
+                    
+                    # Skip empty results
+                    if stats["total_rows"] == 0:
+                        outcomes.append((i, job_id, "empty", f"EMPTY: {stem}", stats))
+                        continue
+                    
+                    # Build response structure
+                    response_data = {
+                        "result": result_data,
+                        "job_id": job_id,
+                        "status": getattr(job_detail, 'status', 'unknown'),
+                    }
+                    
+                    if hasattr(job_detail, 'usage'):
+                        usage = job_detail.usage
+                        if hasattr(usage, 'model_dump'):
+                            response_data["usage"] = usage.model_dump(mode='json')
+                        elif isinstance(usage, dict):
+                            response_data["usage"] = usage
+                    
+                    # Serialized in one call and written with a single write()
+                    output_file.write_bytes(orjson.dumps(
+                        response_data,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    ))
+                    
+                    outcomes.append((i, job_id, "downloaded", f"Downloaded: {stem} ({stats['total_rows']} rows)", stats))
+                else:
+                    outcomes.append((i, job_id, "error", f"No result: {job_id}", None))
+                    
+            except Exception as e:
+                outcomes.append((i, job_id, "error", f"Error {job_id}: {e}", None))
+        
+        return outcomes
+    
+    # Job-detail requests are independent HTTP calls, so issue them concurrently
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            for outcomes in executor.map(download, jobs_by_stem.keys(), jobs_by_stem.values()):
+                for i, job_id, outcome, message, stats in outcomes:
+                    if stats is not None:
+                        stats_cache[job_id] = stats
+                    if outcome == "downloaded":
+                        downloaded += 1
+                        for key in stats_total:
+                            stats_total[key] += stats.get(key, 0)
+                    elif outcome == "empty":
+                        skipped_empty += 1
+                    else:
+                        errors += 1
+                    print(f"[{i}/{len(extraction_jobs)}] {message}")
+    finally:
+        if jobs_by_stem:
+            stats_cache_path.write_bytes(orjson.dumps(stats_cache))
     
     # Summary
     print()
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import csv
-import json
+import os
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from pathlib import Path
 from typing import Any, Iterable, Optional, Tuple
 
 import re
 
+import orjson
+
 NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
 
+# Quantum for rounding fair values to whole dollars
+WHOLE_DOLLAR = Decimal("1")
+
+# Keys holding citation/location metadata, which never contains rows. With
+# citations enabled these make up most of the nodes in an extraction.
+NON_ROW_KEYS = frozenset({"citations", "bbox", "bounding_box", "page_coords"})
+
 DEFAULT_INPUT = (
     Path(__file__).resolve().parent
     / "extract_urls"
@@ -61,17 +70,18 @@ def parse_numeric_value(raw: Any) -> Optional[Decimal]:
 
 def format_dollar(amount: Decimal) -> str:
     """Format a Decimal as dollars with commas, rounded to nearest dollar."""
-    rounded = amount.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    rounded = amount.quantize(WHOLE_DOLLAR, rounding=ROUND_HALF_UP)
     return f"${rounded:,.0f}"
 
 
 def is_holding(node: Any) -> bool:
     """Return True when a node represents a HOLDING row."""
-    if not isinstance(node, dict):
+    # Parsed JSON only holds plain dicts, so an exact type check is enough
+    if type(node) is not dict:
         return False
 
     row_type = node.get("row_type")
-    return isinstance(row_type, dict) and row_type.get("value") == "HOLDING"
+    return type(row_type) is dict and row_type.get("value") == "HOLDING"
 
 
 def extract_investment_name(node: dict[str, Any]) -> str:
@@ -110,38 +120,62 @@ def extract_investment_name(node: dict[str, Any]) -> str:
 
 
 def find_holdings(node: Any) -> Iterable[Tuple[str, Optional[Decimal]]]:
-    """Recursively yield (investment, fair_value) for HOLDING rows."""
-    if isinstance(node, dict):
-        if is_holding(node):
-            name = extract_investment_name(node)
-            fair_value_raw = node.get("fair_value_raw")
-            number: Optional[Decimal] = None
-
-            if isinstance(fair_value_raw, dict):
-                number = parse_numeric_value(fair_value_raw.get("value"))
-
-            yield name, number
-
-        for value in node.values():
-            yield from find_holdings(value)
-
-    elif isinstance(node, list):
-        for item in node:
-            yield from find_holdings(item)
+    """Yield (investment, fair_value) for HOLDING rows, in document order."""
+    # Depth-first walk with an explicit stack instead of one generator frame
+    # per node; children are pushed in reverse so they pop in order. Nodes
+    # come from parsed JSON, so dispatch on the exact type.
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            if is_holding(node):
+                name = extract_investment_name(node)
+                fair_value_raw = node.get("fair_value_raw")
+                number: Optional[Decimal] = None
+
+                if isinstance(fair_value_raw, dict):
+                    number = parse_numeric_value(fair_value_raw.get("value"))
+
+                yield name, number
+
+            if NON_ROW_KEYS.isdisjoint(node):
+                stack.extend(reversed(node.values()))
+            else:
+                stack.extend(reversed([
+                    value for key, value in node.items() if key not in NON_ROW_KEYS
+                ]))
+
+        elif node_type is list:
+            stack.extend(reversed(node))
 
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    return orjson.loads(path.read_bytes())
 
 
-def write_csv(rows: Iterable[Tuple[str, Optional[Decimal]]], output_path: Path) -> None:
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["investment", "fair_value"])
-        for name, amount in rows:
-            display_value = format_dollar(amount) if amount is not None else ""
-            writer.writerow([name, display_value])
+def write_csv(rows: Iterable[Tuple[str, Optional[Decimal]]], output_path: Path) -> int:
+    """
+    Write rows as they arrive and return how many were written.
+
+    Rows go to a temporary file next to output_path, which replaces it only
+    once every row is written, so a failure never leaves a truncated CSV.
+    """
+    count = 0
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["investment", "fair_value"])
+            for name, amount in rows:
+                display_value = format_dollar(amount) if amount is not None else ""
+                writer.writerow([name, display_value])
+                count += 1
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
 
 
 def main(input_path: Optional[str] = None, output_path: Optional[str] = None) -> None:
@@ -152,9 +186,8 @@ def main(input_path: Optional[str] = None, output_path: Optional[str] = None) ->
         raise SystemExit(f"Input file not found: {source}")
 
     data = load_json(source)
-    holdings = list(find_holdings(data))
-    write_csv(holdings, destination)
-    print(f"Wrote {len(holdings)} holdings to {destination}")
+    count = write_csv(find_holdings(data), destination)
+    print(f"Wrote {count} holdings to {destination}")
 
 
 if __name__ == "__main__":
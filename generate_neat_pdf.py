@@ -11,18 +11,35 @@ Converts SEC .txt filings to professional, multi-page PDFs with:
 Usage:
     python generate_neat_pdf.py --input-dir inputs_for_pdf_script --output-dir test-inputs/neat_pdfs
     python generate_neat_pdf.py  # Uses defaults
+    python generate_neat_pdf.py --workers 8 --concurrency 6  # More parallelism
+
+Converted filings are recorded in <output-dir>/.cache.json, so --overwrite
+re-runs skip filings whose input, typography, generator code and PDF are all
+unchanged. Pass --refresh to ignore the record and rebuild every PDF.
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
+import fnmatch
+import hashlib
+import mmap
+import os
 import re
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
 from html import escape as html_escape
 from pathlib import Path
 from typing import Iterable, List, Optional
 
+import orjson
+
 try:
-    from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 except ImportError as e:
     raise SystemExit(
         "Playwright is required.\n\n"
@@ -42,17 +59,47 @@ PEM_HEADER_PREFIXES = (
     "-----BEGIN PKCS #7 SIGNED DATA-----",
 )
 
-# SGML tags to strip for cleaner display
-SGML_TAG_RE = re.compile(
-    r"</?(?:S|C|CAPTION|FN|F\d+|PAGE)>",
+# Document types preferred as the primary document of a filing
+PRIMARY_DOC_TYPES = frozenset({"N-CSR", "N-CSRS", "NCSR", "NCSRS"})
+
+# <DOCUMENT>/<TEXT> open and close tags and <TYPE> with its value, the only
+# tokens needed to split a filing; m.lastindex tells which one matched. A
+# filing is split in one pass over these tokens rather than by lazy DOTALL
+# regexes and per-document searches.
+DOC_TOKEN_RE = re.compile(
+    r"<(?:(DOCUMENT)>|(/DOCUMENT)>|(TEXT)>|(/TEXT)>|TYPE>([^\r\n<]+))",
     flags=re.IGNORECASE,
 )
+_DOC_OPEN, _DOC_CLOSE, _TEXT_OPEN, _TEXT_CLOSE, _DOC_TYPE = 1, 2, 3, 4, 5
+
+# Bytes version for scanning a memory-mapped filing, compiled from the same
+# source. The tags are ASCII and no non-ASCII character case-matches their
+# letters, so it finds the same spans as the str pattern does on the
+# decoded text.
+DOC_TOKEN_BYTES_RE = re.compile(
+    DOC_TOKEN_RE.pattern.encode("ascii"),
+    flags=DOC_TOKEN_RE.flags & ~re.UNICODE,
+)
 
-# Tags that are purely invisible (entire line is just a tag)
-INVISIBLE_LINE_RE = re.compile(
-    r"^\s*</?(?:S|C|CAPTION|FN|F\d+|PAGE)>\s*$",
+# SGML tags to strip for cleaner display. The tag alternation is shared by
+# every tag pattern below so they cannot drift apart.
+_SGML_TAG = r"</?(?:S|C|CAPTION|FN|F\d+|PAGE)>"
+SGML_TAG_RE = re.compile(_SGML_TAG, flags=re.IGNORECASE)
+
+# Tag-only (invisible) lines and non-blank lines, matched over whole texts
+# instead of line by line. [^\S\n] is "whitespace other than newline" so a
+# match never spans lines. Each pattern starts with a literal "\n" so the
+# regex engine can jump between candidate lines; callers prepend "\n" (or
+# handle the leading run) for the first line.
+INVISIBLE_LINE_NL_RE = re.compile(
+    rf"\n[^\S\n]*{_SGML_TAG}[^\S\n]*(?=\n|\Z)",
+    flags=re.IGNORECASE,
+)
+LEADING_INVISIBLE_LINES_RE = re.compile(
+    rf"\A(?:[^\S\n]*{_SGML_TAG}[^\S\n]*(?:\n|\Z))+",
     flags=re.IGNORECASE,
 )
+NONBLANK_LINE_NL_RE = re.compile(r"\n[^\S\n]*\S")
 
 # Pattern to match 3+ consecutive newlines
 EXCESSIVE_NEWLINES_RE = re.compile(r"\n{3,}")
@@ -60,18 +107,31 @@ EXCESSIVE_NEWLINES_RE = re.compile(r"\n{3,}")
 # Pattern to match form-feed characters
 FORM_FEED_RE = re.compile(r"\f")
 
+# <TABLE>...</TABLE> tags used to segment a document into blocks
+TABLE_OPEN_TAG = b"<TABLE>"
+TABLE_CLOSE_TAG = b"</TABLE>"
+
+# Blank-line runs separating the row groups of a table
+TABLE_CHUNK_SEP_RE = re.compile(r"\n\n+")
+
 # Pattern to detect summary/reconciliation blocks that should be glued to the previous block
 # Matches: "Total", "Net Assets", "Members' Capital", "Liabilities", double underlines
+# The leading lookahead is the set of first characters of the alternatives.
+# It lets the regex engine skip ahead with a charset scan, which a
+# case-insensitive alternation otherwise disables, instead of trying every
+# alternative at every offset.
 SUMMARY_CHUNK_RE = re.compile(
-    r"(?:total|net\s+assets|members['\u2019]?\s*capital|liabilities|excess|deficiency|={3,}|-{3,})",
+    r"(?=[tnmled=\-])(?:total|net\s+assets|members['\u2019]?\s*capital|liabilities|excess|deficiency|={3,}|-{3,})",
     flags=re.IGNORECASE,
 )
 
 # Pattern to detect subsection headers that should be glued to the FOLLOWING block
 # Matches: "CATEGORY NAME-X.XX%" or "CATEGORY NAME -- X.XX%" (geographic/type subsections)
 # Examples: "GRAND CAYMAN-1.36%", "CHILEAN MUTUAL FUNDS-1.48%", "U.S. TREASURY BILLS-0.5%"
-SUBSECTION_HEADER_RE = re.compile(
-    r"^\s*[A-Z][A-Za-z\s.&/\-\']+[-\u2013\u2014]\s*\d+\.?\d*\s*%\s*$",
+# Applied to every line of a chunk in one scan: [^\S\n] stands in for \s so a
+# match stays on one line, and the anchored ends absorb surrounding whitespace.
+SUBSECTION_HEADER_LINE_RE = re.compile(
+    r"^[^\S\n]*[A-Z](?:[A-Za-z.&/\-\']|[^\S\n])+[-\u2013\u2014][^\S\n]*\d+\.?\d*[^\S\n]*%[^\S\n]*$",
     flags=re.MULTILINE,
 )
 
@@ -87,16 +147,49 @@ class SecDocument:
     text: str
 
 
-@dataclass
-class TextBlock:
+@dataclass(slots=True)
+class _SegmentBlock:
+    """
+    A contiguous slice of sanitized document text.
+    
+    The slice is kept as a single string; lines are split only on demand, and
+    the display-cleaned text and its visible line count are computed once per
+    block however many times the header/footer scans and HTML emission ask.
+    Slotted, since a filing can be cut into thousands of blocks.
+    """
+    text: str = ""
+    # Lazily filled caches. Plain properties rather than functools.cached_property,
+    # which takes a lock on every uncached access before Python 3.12.
+    _clean_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _visible_lines: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    @property
+    def lines(self) -> List[str]:
+        return self.text.split("\n")
+    
+    @property
+    def clean_text(self) -> str:
+        clean_text = self._clean_text
+        if clean_text is None:
+            clean_text = self._clean_text = _strip_sgml_tags_for_display(self.text)
+        return clean_text
+    
+    @property
+    def visible_lines(self) -> int:
+        visible_lines = self._visible_lines
+        if visible_lines < 0:
+            visible_lines = self._visible_lines = _count_visible_lines(self.clean_text)
+        return visible_lines
+
+
+@dataclass(slots=True)
+class TextBlock(_SegmentBlock):
     """A block of plain text (not inside a <TABLE>)."""
-    lines: List[str] = field(default_factory=list)
 
 
-@dataclass
-class TableBlock:
+@dataclass(slots=True)
+class TableBlock(_SegmentBlock):
     """A block of text inside a <TABLE>...</TABLE> region."""
-    lines: List[str] = field(default_factory=list)
 
 
 Block = TextBlock | TableBlock
@@ -106,6 +199,11 @@ Block = TextBlock | TableBlock
 # Parsing Helpers
 # =============================================================================
 
+def _has_content(text: str) -> bool:
+    """Same as bool(text.strip()), without copying the text."""
+    return bool(text) and not text.isspace()
+
+
 def _strip_pem_envelope(raw: str) -> str:
     """Strip PEM envelope if present, preserving SEC content."""
     if not raw.startswith(PEM_HEADER_PREFIXES):
@@ -116,39 +214,111 @@ def _strip_pem_envelope(raw: str) -> str:
     return raw
 
 
-def _extract_documents_from_sec_txt(raw: str) -> List[SecDocument]:
-    """Extract <DOCUMENT> blocks from an SEC filing."""
-    doc_matches = list(re.finditer(r"<DOCUMENT>(.*?)</DOCUMENT>", raw, flags=re.DOTALL | re.IGNORECASE))
-    if not doc_matches:
-        text = _strip_pem_envelope(raw)
-        return [SecDocument(doc_type="UNKNOWN", text=text)]
-
+def _iter_document_spans(raw, token_re) -> Iterable[tuple[int, int, int, int, Optional[str | bytes]]]:
+    """
+    Yield (start, end, text_start, text_end, doc_type) for each <DOCUMENT> block.
+    
+    A small state machine over the tokens found by token_re, pairing each
+    <DOCUMENT> with the next </DOCUMENT> and, inside it, the first <TEXT>
+    with the next </TEXT>. text_start is -1 when the block has no <TEXT>,
+    and text_end is end when that <TEXT> is never closed. doc_type is the
+    raw value of the block's first <TYPE>, or None. Tokens in the wrong
+    state are ignored, so this finds the same spans as the lazy
+    <DOCUMENT>(.*?)</DOCUMENT> and <TEXT>(.*?)</TEXT> searches did.
+    """
+    start = -1
+    text_start = text_end = -1
+    doc_type = None
+    for m in token_re.finditer(raw):
+        tag = m.lastindex
+        if start == -1:
+            if tag == _DOC_OPEN:
+                start = m.end()
+                text_start = text_end = -1
+                doc_type = None
+        elif tag == _DOC_CLOSE:
+            end = m.start()
+            yield start, end, text_start, (text_end if text_end != -1 else end), doc_type
+            start = -1
+        elif tag == _DOC_TYPE:
+            if doc_type is None:
+                doc_type = m.group(_DOC_TYPE)
+        elif tag == _TEXT_OPEN:
+            if text_start == -1:
+                text_start = m.end()
+        elif tag == _TEXT_CLOSE:
+            if text_start != -1 and text_end == -1:
+                text_end = m.start()
+
+
+def _extract_documents(raw, token_re, decode) -> List[SecDocument]:
+    """
+    Extract <DOCUMENT> blocks from a filing held as str or as bytes.
+    
+    token_re is DOC_TOKEN_RE or DOC_TOKEN_BYTES_RE to match the type of raw,
+    and decode turns a slice of raw into str. Only the <TYPE> value and the
+    <TEXT> slice of each block are decoded.
+    """
     docs: List[SecDocument] = []
-    for m in doc_matches:
-        block = m.group(1)
-        type_match = re.search(r"<TYPE>([^\r\n<]+)", block, flags=re.IGNORECASE)
-        doc_type = (type_match.group(1).strip() if type_match else "UNKNOWN").upper()
-
-        text_match = re.search(r"<TEXT>(.*?)</TEXT>", block, flags=re.DOTALL | re.IGNORECASE)
-        if text_match:
-            text = text_match.group(1)
+    for start, end, text_start, text_end, raw_type in _iter_document_spans(raw, token_re):
+        doc_type = (decode(raw_type).strip() if raw_type is not None else "UNKNOWN").upper()
+
+        if text_start != -1:
+            text = raw[text_start:text_end]
         else:
-            text_start = re.search(r"<TEXT>(.*)$", block, flags=re.DOTALL | re.IGNORECASE)
-            text = text_start.group(1) if text_start else block
+            text = raw[start:end]
 
-        text = _strip_pem_envelope(text)
+        text = _strip_pem_envelope(decode(text))
         docs.append(SecDocument(doc_type=doc_type, text=text))
 
+    if not docs:
+        text = _strip_pem_envelope(decode(raw[:]))
+        return [SecDocument(doc_type="UNKNOWN", text=text)]
+
     return docs
 
 
+def _extract_documents_from_sec_txt(raw: str) -> List[SecDocument]:
+    """Extract <DOCUMENT> blocks from an SEC filing."""
+    return _extract_documents(raw, DOC_TOKEN_RE, str)
+
+
+def _decode_filing_bytes(data: bytes) -> str:
+    """Decode like read_text(encoding="utf-8", errors="replace"), universal newlines included."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _load_documents(txt_path: Path) -> List[SecDocument]:
+    """
+    Read an SEC filing from disk and extract its documents.
+    
+    The file is memory-mapped and scanned as bytes; only the <TYPE> and
+    <TEXT> slices are decoded, so the whole filing is never held as one str
+    next to the per-document copies cut from it.
+    """
+    with open(txt_path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return _extract_documents_from_sec_txt("")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _extract_documents(mm, DOC_TOKEN_BYTES_RE, _decode_filing_bytes)
+
+
 def _pick_primary_doc(docs: List[SecDocument]) -> int:
     """Pick the primary document (prefer N-CSR types, else largest)."""
-    preferred = {"N-CSR", "N-CSRS", "NCSR", "NCSRS"}
+    # One pass: return on the first preferred type, tracking the largest
+    # document (first one wins ties) as the fallback along the way.
+    largest_idx, largest_len = 0, -1
     for i, d in enumerate(docs):
-        if d.doc_type in preferred:
+        if d.doc_type in PRIMARY_DOC_TYPES:
             return i
-    return max(range(len(docs)), key=lambda i: len(docs[i].text))
+        text_len = len(d.text)
+        if text_len > largest_len:
+            largest_idx, largest_len = i, text_len
+    return largest_idx
 
 
 # =============================================================================
@@ -162,11 +332,15 @@ def _sanitize_text(text: str) -> str:
     - Remove form-feed characters
     - Collapse 3+ consecutive newlines to 2
     """
-    # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # Normalize line endings. Text decoded by _decode_filing_bytes is already
+    # normalized, so the common case is one probe instead of two full passes.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     
-    # Remove form-feed characters (they cause artificial page breaks)
-    text = FORM_FEED_RE.sub("", text)
+    # Remove form-feed characters (they cause artificial page breaks). Most
+    # filings have none, and the "in" probe is far cheaper than a sub pass.
+    if "\f" in text:
+        text = FORM_FEED_RE.sub("", text)
     
     # Collapse 3+ consecutive newlines to exactly 2
     text = EXCESSIVE_NEWLINES_RE.sub("\n\n", text)
@@ -176,53 +350,75 @@ def _sanitize_text(text: str) -> str:
 
 def _strip_sgml_tags_for_display(text: str) -> str:
     """Remove SGML tags like <S>, <C>, <PAGE> for cleaner display."""
-    lines = text.split("\n")
-    cleaned = []
-    for line in lines:
-        # Skip lines that are purely SGML tags
-        if INVISIBLE_LINE_RE.match(line):
-            continue
-        # Remove inline tags
-        line = SGML_TAG_RE.sub("", line)
-        cleaned.append(line)
-    return "\n".join(cleaned)
+    # Equivalent to dropping tag-only lines and stripping inline tags line by
+    # line, without the split/join round trip. Kept as three literal-prefixed
+    # passes: a single alternation defeats the engine's prefix scan and is
+    # slower than the original loop.
+    # Every pattern needs a "<"; narrative text usually has none. Text with
+    # a "<" but no display tag (HTML documents, "<" in prose) is checked with
+    # one search instead of three substitution passes.
+    if "<" not in text or not SGML_TAG_RE.search(text):
+        return text
+    text = LEADING_INVISIBLE_LINES_RE.sub("", text, count=1)
+    text = INVISIBLE_LINE_NL_RE.sub("", text)
+    return SGML_TAG_RE.sub("", text)
 
 
 # =============================================================================
 # Block Segmentation (Text vs Table)
 # =============================================================================
 
+def _iter_table_spans(text: str) -> Iterable[tuple[int, int, int, int]]:
+    """
+    Yield (start, content_start, content_end, end) for each <TABLE>...</TABLE>.
+    
+    Matches case-insensitively, like re.IGNORECASE on the literal tags, using
+    substring search instead of a lazy DOTALL regex. The text is folded to
+    ASCII bytes first: encode("ascii", "replace") maps every code point to one
+    byte, so offsets line up with the str, and no non-ASCII character
+    case-matches a letter of TABLE.
+    """
+    folded = text.encode("ascii", "replace").upper()
+    open_len = len(TABLE_OPEN_TAG)
+    close_len = len(TABLE_CLOSE_TAG)
+    pos = 0
+    while True:
+        start = folded.find(TABLE_OPEN_TAG, pos)
+        if start < 0:
+            return
+        close = folded.find(TABLE_CLOSE_TAG, start + open_len)
+        if close < 0:
+            return
+        yield start, start + open_len, close, close + close_len
+        pos = close + close_len
+
+
 def _segment_into_blocks(text: str) -> List[Block]:
     """
     Segment text into TextBlock and TableBlock regions.
     
     SEC filings use <TABLE>...</TABLE> for ASCII tables.
     """
-    # Find all <TABLE>...</TABLE> regions
-    table_re = re.compile(r"<TABLE>(.*?)</TABLE>", flags=re.DOTALL | re.IGNORECASE)
-    
     blocks: List[Block] = []
     last_end = 0
     
-    for m in table_re.finditer(text):
+    for start, content_start, content_end, end in _iter_table_spans(text):
         # Text before this table
-        before = text[last_end:m.start()]
-        if before.strip():
-            blocks.append(TextBlock(lines=before.split("\n")))
+        before = text[last_end:start]
+        if _has_content(before):
+            blocks.append(TextBlock(text=before))
         
         # The table content
-        table_content = m.group(1)
-        table_lines = table_content.split("\n")
-        blocks.append(TableBlock(lines=table_lines))
+        blocks.append(TableBlock(text=text[content_start:content_end]))
         
-        last_end = m.end()
+        last_end = end
     
     # Text after last table
     after = text[last_end:]
-    if after.strip():
-        blocks.append(TextBlock(lines=after.split("\n")))
+    if _has_content(after):
+        blocks.append(TextBlock(text=after))
     
-    return blocks if blocks else [TextBlock(lines=text.split("\n"))]
+    return blocks if blocks else [TextBlock(text=text)]
 
 
 # =============================================================================
@@ -241,6 +437,9 @@ FOOTER_MAX_LINES = 10
 # Maximum total visible lines to accumulate as footers after a table
 MAX_ACCUMULATED_FOOTER_LINES = 15
 
+# Marks table blocks in the per-block visible line counts
+TABLE_LINE_COUNT = -1
+
 # Pattern to detect new section headers (e.g., "Category Name -- X.X%")
 SECTION_HEADER_RE = re.compile(
     r"^\s*[A-Z][A-Za-z\s/&]+\s*--\s*\d+\.?\d*\s*%",
@@ -250,18 +449,18 @@ SECTION_HEADER_RE = re.compile(
 
 def _count_visible_lines(text: str) -> int:
     """Count non-empty lines in text after stripping SGML tags."""
-    lines = text.split("\n")
-    count = 0
-    for line in lines:
-        stripped = line.strip()
-        if stripped and not INVISIBLE_LINE_RE.match(line):
-            count += 1
-    return count
+    # Every invisible (tag-only) line is also non-blank, so the visible count
+    # is the difference of two C-level scans over the whole text.
+    text = "\n" + text
+    nonblank = len(NONBLANK_LINE_NL_RE.findall(text))
+    if nonblank == 0:
+        return 0
+    return nonblank - len(INVISIBLE_LINE_NL_RE.findall(text))
 
 
-def _is_header_candidate(block: TextBlock) -> bool:
+def _is_header_candidate(visible_lines: int) -> bool:
     """
-    Check if a text block qualifies as a header candidate.
+    Check if a text block qualifies as a header candidate, given its visible line count.
     
     Header candidates are short blocks that typically contain:
     - Section titles (e.g., "SCHEDULE OF INVESTMENTS")
@@ -273,16 +472,16 @@ def _is_header_candidate(block: TextBlock) -> bool:
     
     We are permissive here - better to glue too much than too little.
     """
-    block_text = "\n".join(block.lines)
-    clean_text = _strip_sgml_tags_for_display(block_text)
-    visible_lines = _count_visible_lines(clean_text)
     return visible_lines <= HEADER_MAX_LINES
 
 
-def _is_footer_candidate(block: TextBlock) -> bool:
+def _is_footer_candidate(block: TextBlock, visible_lines: int) -> bool:
     """
     Check if a text block qualifies as a footer candidate.
     
+    visible_lines is the block's visible line count, already at hand in the
+    caller's per-document counts.
+    
     Footer candidates are short blocks that typically contain:
     - Subtotal/total lines (e.g., "3,989,082")
     - Separator lines (dashes, whitespace)
@@ -291,21 +490,30 @@ def _is_footer_candidate(block: TextBlock) -> bool:
     
     Returns False if the block looks like a new section header.
     """
-    block_text = "\n".join(block.lines)
-    clean_text = _strip_sgml_tags_for_display(block_text)
-    visible_lines = _count_visible_lines(clean_text)
-    
     # Must be short enough
     if visible_lines > FOOTER_MAX_LINES:
         return False
     
-    # Reject if it looks like a new section header (e.g., "Category -- X.X%")
-    if SECTION_HEADER_RE.search(clean_text):
+    # Reject if it looks like a new section header (e.g., "Category -- X.X%").
+    # The "%" check is a cheap reject for the common case of no percentage.
+    clean_text = block.clean_text
+    if "%" in clean_text and SECTION_HEADER_RE.search(clean_text):
         return False
     
     return True
 
 
+def _exceeds_nonblank_lines(text: str, max_lines: int) -> bool:
+    """
+    Check whether text has more than max_lines lines with any non-whitespace.
+    
+    Stops scanning at the (max_lines + 1)-th such line, so long chunks cost no
+    more than short ones.
+    """
+    matches = NONBLANK_LINE_NL_RE.finditer("\n" + text)
+    return next(islice(matches, max_lines, None), None) is not None
+
+
 def _is_summary_chunk(chunk: str, max_lines: int = 15) -> bool:
     """
     Check if a chunk looks like a summary/reconciliation block.
@@ -313,8 +521,7 @@ def _is_summary_chunk(chunk: str, max_lines: int = 15) -> bool:
     Summary chunks (totals, net assets, members' capital lines) should be
     glued to the previous chunk to prevent awkward page breaks.
     """
-    line_count = len([ln for ln in chunk.split("\n") if ln.strip()])
-    if line_count > max_lines:
+    if _exceeds_nonblank_lines(chunk, max_lines):
         return False
     return bool(SUMMARY_CHUNK_RE.search(chunk))
 
@@ -332,17 +539,26 @@ def _is_subsection_header_chunk(chunk: str, max_lines: int = 5) -> bool:
     - "CHILEAN MUTUAL FUNDS-1.48%"
     - "U.S. TREASURY BILLS-0.5%"
     """
-    lines = [ln for ln in chunk.split("\n") if ln.strip()]
-    if len(lines) > max_lines:
+    # Every subsection header ends in a percentage; most chunks have none
+    if "%" not in chunk:
+        return False
+    if _exceeds_nonblank_lines(chunk, max_lines):
         return False
     # Check if any line matches the subsection header pattern
-    for line in lines:
-        if SUBSECTION_HEADER_RE.match(line.strip()):
-            return True
-    return False
+    return SUBSECTION_HEADER_LINE_RE.search(chunk) is not None
 
 
-def _render_chunked_table(clean_text: str) -> str:
+def _escape_text(text: str) -> str:
+    """
+    Escape text for use as element content.
+    
+    Quotes only need escaping inside attribute values, so skipping them saves
+    two full passes over every <pre> body (and keeps the HTML smaller).
+    """
+    return html_escape(text, quote=False)
+
+
+def _render_chunked_table(clean_text: str) -> List[str]:
     """
     Split table content into logical chunks and wrap each in a protected div.
     
@@ -356,13 +572,16 @@ def _render_chunked_table(clean_text: str) -> str:
     2. Subsection header chunks (e.g., "GRAND CAYMAN-1.36%") are merged into
        the FOLLOWING chunk (forward merge) to keep headers with their content.
     
-    Returns HTML string with each chunk wrapped in <div class="table-chunk">.
+    Returns one HTML fragment per chunk, each wrapped in
+    <div class="table-chunk">, for the caller to extend its output list with.
     """
     # Split by double newlines to identify logical row groups
-    raw_chunks = re.split(r"\n\n+", clean_text)
+    raw_chunks = TABLE_CHUNK_SEP_RE.split(clean_text)
     
-    # First pass: backward merge summary chunks into previous chunk
-    backward_merged: List[str] = []
+    # First pass: backward merge summary chunks into previous chunk.
+    # Each merged chunk is kept as a list of parts and joined once, so a long
+    # run of summary chunks does not re-copy the growing string every time.
+    backward_merged: List[List[str]] = []
     for chunk in raw_chunks:
         chunk = chunk.rstrip()  # Preserve leading whitespace for column alignment
         if not chunk:
@@ -371,17 +590,19 @@ def _render_chunked_table(clean_text: str) -> str:
         # Check if this is a summary chunk that should be glued to the previous
         if _is_summary_chunk(chunk) and backward_merged:
             # Merge into the previous chunk with double newline to preserve spacing
-            backward_merged[-1] = backward_merged[-1] + "\n\n" + chunk
+            backward_merged[-1].append(chunk)
         else:
             # Start a new chunk
-            backward_merged.append(chunk)
+            backward_merged.append([chunk])
     
     # Second pass: forward merge subsection headers into the following chunk
-    # We process in reverse to handle consecutive headers correctly
-    final_chunks: List[str] = []
+    # We process in reverse to handle consecutive headers correctly. Parts of
+    # each final chunk are collected back to front and reversed on output.
+    final_chunks: List[List[str]] = []
     pending_header: Optional[str] = None
     
-    for chunk in reversed(backward_merged):
+    for parts in reversed(backward_merged):
+        chunk = "\n\n".join(parts)
         if pending_header:
             # Prepend the pending header to this chunk
             chunk = pending_header + "\n\n" + chunk
@@ -392,34 +613,50 @@ def _render_chunked_table(clean_text: str) -> str:
             # Hold this chunk to prepend to the next one
             if final_chunks:
                 # Prepend to the most recent chunk we've built
-                final_chunks[-1] = chunk + "\n\n" + final_chunks[-1]
+                final_chunks[-1].append(chunk)
             else:
                 # No following chunk yet, save as pending
                 pending_header = chunk
         else:
-            final_chunks.append(chunk)
+            final_chunks.append([chunk])
     
     # If there's a leftover pending header, add it as its own chunk
     if pending_header:
-        final_chunks.append(pending_header)
+        final_chunks.append([pending_header])
     
     # Reverse back to original order
     final_chunks.reverse()
     
     # Emit each merged chunk as a single protected div
     html_chunks: List[str] = []
-    for chunk in final_chunks:
+    for parts in final_chunks:
+        chunk = "\n\n".join(reversed(parts))
         html_chunks.append(
-            f'<div class="table-chunk"><pre class="filing">{html_escape(chunk)}</pre></div>'
+            f'<div class="table-chunk"><pre class="filing">{_escape_text(chunk)}</pre></div>'
         )
     
-    return "\n".join(html_chunks)
+    return html_chunks
 
 
-def _collect_header_blocks(blocks: List[Block], table_idx: int) -> List[int]:
+def _visible_line_counts(blocks: List[Block]) -> array:
+    """
+    Visible line count of every block, with TABLE_LINE_COUNT for tables.
+    
+    Built once per document so the header/footer scans around each table
+    walk a flat integer array instead of type-checking block objects.
+    """
+    return array("i", [
+        TABLE_LINE_COUNT if isinstance(block, TableBlock) else block.visible_lines
+        for block in blocks
+    ])
+
+
+def _collect_header_blocks(blocks: List[Block], visible_counts: array, table_idx: int) -> List[int]:
     """
     Scan backwards from a table block to collect all preceding header candidate blocks.
     
+    visible_counts comes from _visible_line_counts(blocks).
+    
     Returns a list of block indices (in forward order) that should be glued to the table.
     Stops when we hit:
     - A non-header (long text block)
@@ -436,27 +673,18 @@ def _collect_header_blocks(blocks: List[Block], table_idx: int) -> List[int]:
     
     # Scan backwards from the block before the table
     for i in range(table_idx - 1, -1, -1):
-        block = blocks[i]
+        block_lines = visible_counts[i]
         
         # Stop if we hit another table
-        if isinstance(block, TableBlock):
-            break
-        
-        # Must be a TextBlock
-        if not isinstance(block, TextBlock):
+        if block_lines == TABLE_LINE_COUNT:
             break
         
-        # Get the clean text and line count
-        block_text = "\n".join(block.lines)
-        clean_text = _strip_sgml_tags_for_display(block_text)
-        block_lines = _count_visible_lines(clean_text)
-        
         # Skip empty blocks but continue scanning
         if block_lines == 0:
             continue
         
         # Check if it's a header candidate
-        if not _is_header_candidate(block):
+        if not _is_header_candidate(block_lines):
             break
         
         # Check accumulated line limit
@@ -472,10 +700,12 @@ def _collect_header_blocks(blocks: List[Block], table_idx: int) -> List[int]:
     return header_indices
 
 
-def _collect_footer_blocks(blocks: List[Block], table_idx: int) -> List[int]:
+def _collect_footer_blocks(blocks: List[Block], visible_counts: array, table_idx: int) -> List[int]:
     """
     Scan forwards from a table block to collect all following footer candidate blocks.
     
+    visible_counts comes from _visible_line_counts(blocks).
+    
     Returns a list of block indices that should be glued to the table.
     Stops when we hit:
     - A non-footer (long text block or new section header)
@@ -490,27 +720,18 @@ def _collect_footer_blocks(blocks: List[Block], table_idx: int) -> List[int]:
     
     # Scan forwards from the block after the table
     for i in range(table_idx + 1, len(blocks)):
-        block = blocks[i]
+        block_lines = visible_counts[i]
         
         # Stop if we hit another table
-        if isinstance(block, TableBlock):
+        if block_lines == TABLE_LINE_COUNT:
             break
         
-        # Must be a TextBlock
-        if not isinstance(block, TextBlock):
-            break
-        
-        # Get the clean text and line count
-        block_text = "\n".join(block.lines)
-        clean_text = _strip_sgml_tags_for_display(block_text)
-        block_lines = _count_visible_lines(clean_text)
-        
         # Skip empty blocks but continue scanning
         if block_lines == 0:
             continue
         
         # Check if it's a footer candidate
-        if not _is_footer_candidate(block):
+        if not _is_footer_candidate(blocks[i], block_lines):
             break
         
         # Check accumulated line limit
@@ -524,135 +745,27 @@ def _collect_footer_blocks(blocks: List[Block], table_idx: int) -> List[int]:
     return footer_indices
 
 
-def _build_html(
-    docs: List[SecDocument],
-    *,
-    primary_idx: int,
-    font_size_px: int = 10,
-    line_height_px: int = 13,
-) -> str:
+# Fixed HTML skeleton around the CSS and the generated body
+HTML_HEAD_OPEN = '<!doctype html>\n<html>\n  <head>\n    <meta charset="utf-8" />\n    <style>'
+HTML_BODY_OPEN = '</style>\n  </head>\n  <body>\n    '
+HTML_BODY_CLOSE = '\n  </body>\n</html>'
+
+
+@lru_cache(maxsize=64)
+def _doc_header_html(doc_type: str) -> str:
+    """Heading fragment for a document; filings reuse a handful of types."""
+    return f'<div class="doc-header">DOCUMENT TYPE: {_escape_text(doc_type)}</div>'
+
+
+@lru_cache(maxsize=32)
+def _css_for(font_size_px: int, line_height_px: int) -> str:
     """
-    Build HTML from SEC documents with CSS-based pagination.
+    CSS with landscape layout and table protection.
     
-    Uses 'break-inside: avoid' on table blocks to prevent table splits.
-    Glues preceding header blocks and following footer blocks to tables.
+    Cached per typography so a batch converted with the same settings formats
+    the stylesheet once per process instead of once per filing.
     """
-    html_parts: List[str] = []
-    
-    # Process documents in order (primary first)
-    order = [primary_idx] + [i for i in range(len(docs)) if i != primary_idx]
-    
-    for doc_idx in order:
-        doc = docs[doc_idx]
-        
-        # Document header
-        html_parts.append(f'<div class="doc-header">DOCUMENT TYPE: {html_escape(doc.doc_type)}</div>')
-        
-        # Sanitize the document text
-        sanitized_text = _sanitize_text(doc.text)
-        
-        # Segment into blocks
-        blocks = _segment_into_blocks(sanitized_text)
-        
-        # Track which blocks have been consumed (glued to a table)
-        consumed: set[int] = set()
-        
-        # First pass: identify all table blocks and their associated headers/footers
-        # table_idx -> (header_indices, footer_indices)
-        table_groups: dict[int, tuple[List[int], List[int]]] = {}
-        for i, block in enumerate(blocks):
-            if isinstance(block, TableBlock):
-                header_indices = _collect_header_blocks(blocks, i)
-                footer_indices = _collect_footer_blocks(blocks, i)
-                table_groups[i] = (header_indices, footer_indices)
-                consumed.update(header_indices)
-                consumed.update(footer_indices)
-        
-        # Second pass: emit HTML in order
-        i = 0
-        while i < len(blocks):
-            # Skip if already consumed as a header or footer
-            if i in consumed:
-                i += 1
-                continue
-            
-            current_block = blocks[i]
-            
-            # Check if this is a table with associated headers/footers
-            if isinstance(current_block, TableBlock) and i in table_groups:
-                header_indices, footer_indices = table_groups[i]
-                
-                # Get table content
-                table_text = "\n".join(current_block.lines)
-                clean_table = _strip_sgml_tags_for_display(table_text)
-                
-                has_context = header_indices or footer_indices
-                
-                if has_context:
-                    # Wrap headers + table + footers in a shared container
-                    html_parts.append('<div class="table-with-context">')
-                    
-                    # Emit all header blocks
-                    for h_idx in header_indices:
-                        header_block = blocks[h_idx]
-                        header_text = "\n".join(header_block.lines)
-                        clean_header = _strip_sgml_tags_for_display(header_text)
-                        if clean_header.strip():
-                            html_parts.append(f'<pre class="filing header-text">{html_escape(clean_header)}</pre>')
-                    
-                    # Emit the table as chunks
-                    if clean_table.strip():
-                        html_parts.append(_render_chunked_table(clean_table))
-                    
-                    # Emit all footer blocks
-                    for f_idx in footer_indices:
-                        footer_block = blocks[f_idx]
-                        footer_text = "\n".join(footer_block.lines)
-                        clean_footer = _strip_sgml_tags_for_display(footer_text)
-                        if clean_footer.strip():
-                            html_parts.append(f'<pre class="filing footer-text">{html_escape(clean_footer)}</pre>')
-                    
-                    html_parts.append('</div>')
-                else:
-                    # Table without context - render as chunks
-                    if clean_table.strip():
-                        html_parts.append('<div class="table-wrapper">')
-                        html_parts.append(_render_chunked_table(clean_table))
-                        html_parts.append('</div>')
-                
-                i += 1
-                continue
-            
-            # Normal processing for standalone text blocks
-            block_text = "\n".join(current_block.lines)
-            clean_text = _strip_sgml_tags_for_display(block_text)
-            
-            # Skip empty blocks
-            if not clean_text.strip():
-                i += 1
-                continue
-            
-            if isinstance(current_block, TableBlock):
-                # Orphan table (shouldn't happen, but handle it)
-                html_parts.append('<div class="table-wrapper">')
-                html_parts.append(_render_chunked_table(clean_text))
-                html_parts.append('</div>')
-            else:
-                # Regular text block (not consumed as header/footer)
-                html_parts.append(
-                    f'<pre class="filing">{html_escape(clean_text)}</pre>'
-                )
-            
-            i += 1
-        
-        # Add separator between documents
-        if doc_idx != order[-1]:
-            html_parts.append('<div class="doc-separator"></div>')
-    
-    body = "\n".join(html_parts)
-    
-    # CSS with landscape layout and table protection
-    css = f"""
+    return f"""
 @page {{
     size: 14in 8.5in landscape;
     margin: 0.3in 0.2in;
@@ -750,110 +863,497 @@ body {{
 }}
 """
 
-    return f"""<!doctype html>
-<html>
-  <head>
-    <meta charset="utf-8" />
-    <style>{css}</style>
-  </head>
-  <body>
-    {body}
-  </body>
-</html>"""
+
+def _build_html(
+    docs: List[SecDocument],
+    *,
+    primary_idx: int,
+    font_size_px: int = 10,
+    line_height_px: int = 13,
+) -> str:
+    """
+    Build HTML from SEC documents with CSS-based pagination.
+    
+    Uses 'break-inside: avoid' on table blocks to prevent table splits.
+    Glues preceding header blocks and following footer blocks to tables.
+    """
+    html_parts: List[str] = []
+    
+    # Process documents in order (primary first)
+    order = [primary_idx] + [i for i in range(len(docs)) if i != primary_idx]
+    
+    for doc_idx in order:
+        doc = docs[doc_idx]
+        
+        # Document header
+        html_parts.append(_doc_header_html(doc.doc_type))
+        
+        # Sanitize the document text
+        sanitized_text = _sanitize_text(doc.text)
+        
+        # Segment into blocks
+        blocks = _segment_into_blocks(sanitized_text)
+        
+        # Track which blocks have been consumed (glued to a table), one flag
+        # per block indexed directly instead of hashed into a set
+        consumed = bytearray(len(blocks))
+        
+        # First pass: identify all table blocks and their associated headers/footers
+        # table_idx -> (header_indices, footer_indices)
+        table_groups: dict[int, tuple[List[int], List[int]]] = {}
+        visible_counts: Optional[array] = None
+        for i, block in enumerate(blocks):
+            if isinstance(block, TableBlock):
+                if visible_counts is None:
+                    visible_counts = _visible_line_counts(blocks)
+                header_indices = _collect_header_blocks(blocks, visible_counts, i)
+                footer_indices = _collect_footer_blocks(blocks, visible_counts, i)
+                table_groups[i] = (header_indices, footer_indices)
+                for j in header_indices:
+                    consumed[j] = 1
+                for j in footer_indices:
+                    consumed[j] = 1
+        
+        # Second pass: emit HTML in order
+        for i, current_block in enumerate(blocks):
+            # Skip if already consumed as a header or footer
+            if consumed[i]:
+                continue
+            
+            # Check if this is a table with associated headers/footers. Only
+            # tables are in table_groups, so text blocks need no type check.
+            table_group = table_groups.get(i)
+            if table_group is not None:
+                header_indices, footer_indices = table_group
+                
+                # Get table content
+                clean_table = current_block.clean_text
+                
+                has_context = header_indices or footer_indices
+                
+                if has_context:
+                    # Wrap headers + table + footers in a shared container
+                    html_parts.append('<div class="table-with-context">')
+                    
+                    # Emit all header blocks
+                    for h_idx in header_indices:
+                        header_block = blocks[h_idx]
+                        clean_header = header_block.clean_text
+                        if _has_content(clean_header):
+                            html_parts.append(f'<pre class="filing header-text">{_escape_text(clean_header)}</pre>')
+                    
+                    # Emit the table as chunks
+                    if _has_content(clean_table):
+                        html_parts.extend(_render_chunked_table(clean_table))
+                    
+                    # Emit all footer blocks
+                    for f_idx in footer_indices:
+                        footer_block = blocks[f_idx]
+                        clean_footer = footer_block.clean_text
+                        if _has_content(clean_footer):
+                            html_parts.append(f'<pre class="filing footer-text">{_escape_text(clean_footer)}</pre>')
+                    
+                    html_parts.append('</div>')
+                else:
+                    # Table without context - render as chunks
+                    if _has_content(clean_table):
+                        html_parts.append('<div class="table-wrapper">')
+                        html_parts.extend(_render_chunked_table(clean_table))
+                        html_parts.append('</div>')
+                
+                continue
+            
+            # Normal processing for standalone text blocks
+            clean_text = current_block.clean_text
+            
+            # Skip empty blocks
+            if not _has_content(clean_text):
+                continue
+            
+            if isinstance(current_block, TableBlock):
+                # Orphan table (shouldn't happen, but handle it)
+                html_parts.append('<div class="table-wrapper">')
+                html_parts.extend(_render_chunked_table(clean_text))
+                html_parts.append('</div>')
+            else:
+                # Regular text block (not consumed as header/footer)
+                html_parts.append(
+                    f'<pre class="filing">{_escape_text(clean_text)}</pre>'
+                )
+        
+        # Add separator between documents
+        if doc_idx != order[-1]:
+            html_parts.append('<div class="doc-separator"></div>')
+    
+    css = _css_for(font_size_px, line_height_px)
+    
+    # All fragments are joined exactly once, straight into the final document
+    return "".join((HTML_HEAD_OPEN, css, HTML_BODY_OPEN, "\n".join(html_parts), HTML_BODY_CLOSE))
 
 
 # =============================================================================
 # PDF Rendering
 # =============================================================================
 
+# Renders per pooled page before it is closed and replaced
+PAGE_MAX_USES = 100
+
+
 class PdfRenderer:
-    """Context manager for Playwright-based PDF rendering."""
+    """
+    Async context manager for Playwright-based PDF rendering.
     
-    def __init__(self, *, timeout_ms: int = 60000) -> None:
+    A single browser context is shared and at most max_pages renders run at
+    once, so Chromium works on several filings while the next HTML is built.
+    Pages are pooled and reused across filings rather than opened and closed
+    per file; each is recycled after PAGE_MAX_USES renders to bound renderer
+    memory growth. The pool is filled on entry, while the first HTML is still
+    being built, so the first renders don't wait on page creation.
+    """
+    
+    def __init__(self, *, timeout_ms: int = 60000, max_pages: int = 4) -> None:
         self._timeout_ms = timeout_ms
+        self._max_pages = max_pages
+        self._page_slots = asyncio.Semaphore(max_pages)
+        # Idle pages as (page, times used); at most max_pages exist at once
+        self._idle_pages: list[tuple[Page, int]] = []
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
 
-    def __enter__(self) -> "PdfRenderer":
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch()
-        self._context = self._browser.new_context(viewport={"width": 1600, "height": 900})
+    async def __aenter__(self) -> "PdfRenderer":
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self._context = await self._browser.new_context(viewport={"width": 1600, "height": 900})
+        pages = await asyncio.gather(*(self._context.new_page() for _ in range(self._max_pages)))
+        self._idle_pages.extend((page, 0) for page in pages)
         return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        for page, _ in self._idle_pages:
+            await page.close()
+        self._idle_pages.clear()
         if self._context:
-            self._context.close()
+            await self._context.close()
         if self._browser:
-            self._browser.close()
+            await self._browser.close()
         if self._playwright:
-            self._playwright.stop()
+            await self._playwright.stop()
 
-    def render(self, html: str, output_pdf: Path) -> None:
-        """Render HTML to PDF with CSS-driven pagination."""
+    async def render(self, html_path: Path, output_pdf: Path) -> None:
+        """
+        Render an HTML file to PDF with CSS-driven pagination.
+        
+        The page navigates to the file:// URL, so Chromium reads the document
+        from disk instead of having the whole HTML string sent over the
+        DevTools protocol as set_content does.
+        """
         output_pdf.parent.mkdir(parents=True, exist_ok=True)
         if self._context is None:
             raise RuntimeError("PdfRenderer not started")
 
-        page: Page = self._context.new_page()
-        try:
-            page.set_content(html, wait_until="load", timeout=self._timeout_ms)
-            page.pdf(
-                path=str(output_pdf),
-                print_background=True,
-                prefer_css_page_size=True,
-            )
-        finally:
-            page.close()
+        async with self._page_slots:
+            if self._idle_pages:
+                page, uses = self._idle_pages.pop()
+            else:
+                page, uses = await self._context.new_page(), 0
+            reusable = False
+            try:
+                # The HTML is self-contained (inline CSS, system fonts, no
+                # images), so there are no subresources for "load" to wait on
+                await page.goto(html_path.absolute().as_uri(), wait_until="domcontentloaded", timeout=self._timeout_ms)
+                # Backgrounds stay on: the doc headers and table blocks are shaded
+                await page.pdf(
+                    path=str(output_pdf),
+                    print_background=True,
+                    prefer_css_page_size=True,
+                )
+                # Drop the document before the page goes back to the pool
+                await page.goto("about:blank")
+                reusable = True
+            finally:
+                uses += 1
+                if reusable and uses < PAGE_MAX_USES:
+                    self._idle_pages.append((page, uses))
+                else:
+                    # Failed renders may leave the page in a bad state
+                    await page.close()
 
 
 # =============================================================================
 # File Processing
 # =============================================================================
 
-def convert_one(
+# Record of converted filings, kept in the output directory. Maps each input
+# path (relative to the input directory) to [input mtime_ns, input size,
+# font_size_px, line_height_px, GENERATOR_VERSION, PDF mtime_ns].
+CONVERSION_CACHE_NAME = ".cache.json"
+
+# Hash of this file, so any change to the HTML/CSS generation invalidates
+# every recorded conversion without anyone having to bump a version by hand
+GENERATOR_VERSION = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+def _load_conversion_cache(cache_path: Path) -> dict:
+    """Return the conversion record, or an empty one if missing or unreadable."""
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _is_conversion_current(
+    cached: object,
+    entry: list,
+    output_pdf: Path,
+    output_html: Optional[Path] = None,
+) -> bool:
+    """
+    Return True when the recorded conversion cached matches entry and
+    output_pdf has not been touched since.
+    
+    output_html is the HTML that --keep-html asks for; it must exist too,
+    since a run without --keep-html never wrote it.
+    """
+    if not isinstance(cached, list) or cached[:len(entry)] != entry:
+        return False
+    if output_html is not None and not output_html.exists():
+        return False
+    try:
+        return output_pdf.stat().st_mtime_ns == cached[len(entry)]
+    except (OSError, IndexError):
+        return False
+
+
+def build_html_for_file(
     txt_path: Path,
     *,
-    input_dir: Path,
+    output_html: Path,
+    font_size_px: int,
+    line_height_px: int,
+) -> None:
+    """
+    Read a .txt filing and write its HTML to output_html.
+    
+    Pure CPU work with no Playwright state, so it runs in a worker process.
+    Writing the file here keeps that disk I/O off the event loop, and the
+    HTML never has to be pickled back to the parent process.
+    """
+    docs = _load_documents(txt_path)
+    primary_idx = _pick_primary_doc(docs)
+
+    html = _build_html(
+        docs,
+        primary_idx=primary_idx,
+        font_size_px=font_size_px,
+        line_height_px=line_height_px,
+    )
+
+    output_html.parent.mkdir(parents=True, exist_ok=True)
+    output_html.write_text(html, encoding="utf-8")
+
+
+async def convert_one(
+    txt_path: Path,
+    *,
+    rel: str,
     output_dir: Path,
     overwrite: bool,
     keep_html: bool,
+    scratch_html: Path,
     renderer: PdfRenderer,
+    build_pool: ProcessPoolExecutor,
+    cache: dict,
     font_size_px: int,
     line_height_px: int,
 ) -> Optional[Path]:
-    """Convert a single .txt file to PDF."""
-    rel = txt_path.relative_to(input_dir)
+    """
+    Convert a single .txt file to PDF.
+    
+    rel is txt_path relative to the input directory. The HTML is built on build_pool and then rendered by the shared renderer,
+    so parsing of one filing overlaps with Chromium printing another. It is
+    handed over as a file: next to the PDF with keep_html, otherwise at
+    scratch_html, which is removed once the PDF is written.
+    
+    Returns None when the PDF is skipped: it exists and overwrite is off, or
+    cache shows it was made from this same input, typography and generator
+    code, has not been touched since, and (with keep_html) its HTML is still
+    there. Converted filings are recorded in cache.
+    """
     output_pdf = (output_dir / rel).with_suffix(".pdf")
     output_html = output_pdf.with_suffix(".html")
 
     if output_pdf.exists() and not overwrite:
         return None
 
-    raw = txt_path.read_text(encoding="utf-8", errors="replace")
-    docs = _extract_documents_from_sec_txt(raw)
-    primary_idx = _pick_primary_doc(docs)
+    cache_key = rel.replace(os.sep, "/")
+    src = txt_path.stat()
+    entry = [src.st_mtime_ns, src.st_size, font_size_px, line_height_px, GENERATOR_VERSION]
+    if _is_conversion_current(
+        cache.get(cache_key),
+        entry,
+        output_pdf,
+        output_html if keep_html else None,
+    ):
+        return None
 
-    html = _build_html(
-        docs,
-        primary_idx=primary_idx,
+    html_path = output_html if keep_html else scratch_html
+    build = partial(
+        build_html_for_file,
+        txt_path,
+        output_html=html_path,
         font_size_px=font_size_px,
         line_height_px=line_height_px,
     )
-
-    if keep_html:
-        output_html.parent.mkdir(parents=True, exist_ok=True)
-        output_html.write_text(html, encoding="utf-8")
-
-    renderer.render(html, output_pdf)
+    try:
+        await asyncio.get_running_loop().run_in_executor(build_pool, build)
+        await renderer.render(html_path, output_pdf)
+    finally:
+        if not keep_html:
+            html_path.unlink(missing_ok=True)
+    cache[cache_key] = entry + [output_pdf.stat().st_mtime_ns]
     return output_pdf
 
 
-def iter_input_files(input_dir: Path, pattern: str, recursive: bool) -> Iterable[Path]:
-    """Iterate over input files matching the pattern."""
-    if recursive:
-        return sorted(input_dir.rglob(pattern))
-    return sorted(input_dir.glob(pattern))
+def iter_input_files(input_dir: Path, pattern: str, recursive: bool) -> List[Path]:
+    """
+    Return the regular files matching the pattern, sorted.
+    
+    Walks the tree with os.scandir, so whether an entry is a file or a
+    directory comes from the directory listing instead of a stat() per path.
+    Like rglob, symlinked directories are not descended into. Patterns that
+    span directories fall back to glob/rglob.
+    """
+    if "/" in pattern or os.sep in pattern:
+        paths = input_dir.rglob(pattern) if recursive else input_dir.glob(pattern)
+        return sorted(p for p in paths if p.is_file())
+    
+    files: List[Path] = []
+    pending = [str(input_dir)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Like rglob, skip directories that can't be listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                    files.append(Path(entry.path))
+    files.sort()
+    return files
+
+
+def _input_size(path: Path) -> int:
+    """Size of an input file for scheduling; 0 if it can't be stat()ed."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        # Left for convert_one to report as an error
+        return 0
+
+
+async def convert_all(
+    files: List[Path],
+    *,
+    input_dir: Path,
+    output_dir: Path,
+    args: argparse.Namespace,
+) -> dict:
+    """
+    Convert files concurrently: HTML is built on args.workers processes and
+    rendered on up to args.concurrency browser pages at a time.
+    
+    Files are started largest first, so a big filing doesn't end up
+    building and rendering alone after everything else has finished.
+    Progress lines are printed as each file finishes and numbered in input
+    order. Returns converted/skipped/errors counts.
+    
+    The conversion record in output_dir is read first (unless args.refresh)
+    and written back afterwards, even when --fail-fast stops the run early.
+    """
+    counts = {"converted": 0, "skipped": 0, "errors": 0}
+    total = len(files)
+    
+    cache_path = output_dir / CONVERSION_CACHE_NAME
+    cache = {} if args.refresh else _load_conversion_cache(cache_path)
+    # Without --overwrite only existing PDFs are skipped; with it, only
+    # filings the record shows as unchanged
+    skip_reason = "unchanged" if args.overwrite else "exists"
+    
+    # Files come from iter_input_files on the resolved input_dir, so they all
+    # share its string prefix; slicing is cheaper than relative_to().
+    root_len = len(os.path.join(str(input_dir), ""))
+    
+    # Keep each file's input-order number for progress lines
+    jobs = sorted(
+        enumerate(files, start=1),
+        key=lambda job: _input_size(job[1]),
+        reverse=True,
+    )
+    
+    # Bound files in flight so built-but-unrendered HTML files don't pile up
+    # when building outpaces rendering.
+    in_flight = asyncio.Semaphore(args.workers + args.concurrency)
+    
+    # Pages are opened up front, so don't open more than there are files
+    renderer = PdfRenderer(timeout_ms=args.timeout_ms, max_pages=min(args.concurrency, total))
+    # Holds each filing's HTML between building and rendering unless --keep-html
+    with (
+        tempfile.TemporaryDirectory(prefix="neat-pdf-") as scratch_dir,
+        ProcessPoolExecutor(max_workers=args.workers) as build_pool,
+    ):
+        async with renderer:
+            
+            async def _one(i: int, path: Path) -> None:
+                rel = str(path)[root_len:]
+                async with in_flight:
+                    try:
+                        out = await convert_one(
+                            path,
+                            rel=rel,
+                            output_dir=output_dir,
+                            overwrite=args.overwrite,
+                            keep_html=args.keep_html,
+                            scratch_html=Path(scratch_dir, f"{i}.html"),
+                            renderer=renderer,
+                            build_pool=build_pool,
+                            cache=cache,
+                            font_size_px=args.font_size_px,
+                            line_height_px=args.line_height_px,
+                        )
+                        if out is None:
+                            counts["skipped"] += 1
+                            print(f"[{i}/{total}] SKIP {rel} ({skip_reason})")
+                        else:
+                            counts["converted"] += 1
+                            print(f"[{i}/{total}] OK   {rel}")
+                    except Exception as e:
+                        counts["errors"] += 1
+                        print(f"[{i}/{total}] ERR  {path}: {e}")
+                        if args.fail_fast:
+                            raise
+            
+            # With --fail-fast the first error propagates out of gather(). The
+            # other conversions are cancelled and awaited before the renderer
+            # is torn down, so they don't fail with "Target closed" on top of it.
+            tasks = [asyncio.create_task(_one(i, path)) for i, path in jobs]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                if counts["converted"]:
+                    cache_path.write_bytes(orjson.dumps(cache))
+    
+    return counts
 
 
 # =============================================================================
@@ -942,6 +1442,11 @@ def main() -> int:
         action="store_true",
         help="Overwrite existing PDFs.",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=f"Ignore the {CONVERSION_CACHE_NAME} record and rebuild every PDF (with --overwrite).",
+    )
     parser.add_argument(
         "--keep-html", 
         action="store_true",
@@ -975,7 +1480,27 @@ def main() -> int:
         help="Timeout in milliseconds for PDF generation.",
     )
     
+    # Concurrency
+    parser.add_argument(
+        "--workers",
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes building HTML from filings in parallel (capped at the number of files).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of PDFs rendered at once (one browser page each).",
+    )
+    
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers/--jobs must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
     
     # Resolve input directory (positional takes precedence over --input-dir)
     if args.input is not None:
@@ -991,50 +1516,28 @@ def main() -> int:
     else:
         output_dir = _get_next_batch_dir(args.output_base)
     
-    if not input_dir.exists():
+    if not input_dir.is_dir():
         print(f"Error: Input directory does not exist: {input_dir}")
         return 1
     
-    files = [p for p in iter_input_files(input_dir, args.glob_pattern, args.recursive) if p.is_file()]
+    files = iter_input_files(input_dir, args.glob_pattern, args.recursive)
     if not files:
         print(f"No files matched '{args.glob_pattern}' under {input_dir}")
         return 1
     
+    # No point forking more HTML workers than there are filings
+    args.workers = min(args.workers, len(files))
+    
     print(f"Input:       {input_dir}")
     print(f"Output:      {output_dir}")
     print(f"Files:       {len(files)} (recursive={args.recursive}, glob={args.glob_pattern})")
     print(f"Font:        {args.font_size_px}px, line-height: {args.line_height_px}px")
+    print(f"Parallel:    {args.workers} HTML workers, {args.concurrency} pages")
     print(f"Overwrite:   {args.overwrite}")
     print()
     
-    converted = 0
-    skipped = 0
-    errors = 0
-    
-    with PdfRenderer(timeout_ms=args.timeout_ms) as renderer:
-        for i, path in enumerate(files, start=1):
-            try:
-                out = convert_one(
-                    path,
-                    input_dir=input_dir,
-                    output_dir=output_dir,
-                    overwrite=args.overwrite,
-                    keep_html=args.keep_html,
-                    renderer=renderer,
-                    font_size_px=args.font_size_px,
-                    line_height_px=args.line_height_px,
-                )
-                if out is None:
-                    skipped += 1
-                    print(f"[{i}/{len(files)}] SKIP {path.relative_to(input_dir)} (exists)")
-                else:
-                    converted += 1
-                    print(f"[{i}/{len(files)}] OK   {path.relative_to(input_dir)}")
-            except Exception as e:
-                errors += 1
-                print(f"[{i}/{len(files)}] ERR  {path}: {e}")
-                if args.fail_fast:
-                    raise
+    counts = asyncio.run(convert_all(files, input_dir=input_dir, output_dir=output_dir, args=args))
+    converted, skipped, errors = counts["converted"], counts["skipped"], counts["errors"]
     
     print()
     print(f"Done. converted={converted} skipped={skipped} errors={errors}")
@@ -0,0 +1,51 @@
+"""
+Regression test for generate_neat_pdf's conversion record (.cache.json).
+
+With --overwrite, a filing is only skipped when its recorded conversion is
+still current; generator changes and a missing --keep-html HTML must
+trigger a rebuild.
+
+Run: python -m pytest generate_neat_pdf_regression_test.py
+"""
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from generate_neat_pdf import GENERATOR_VERSION, _is_conversion_current
+
+
+def _setup(tmp_path):
+    pdf = tmp_path / "f.pdf"
+    pdf.write_bytes(b"%PDF")
+    entry = [1, 2, 10, 13, GENERATOR_VERSION]
+    return pdf, entry, entry + [pdf.stat().st_mtime_ns]
+
+
+def test_unchanged_conversion_is_skipped(tmp_path):
+    pdf, entry, cached = _setup(tmp_path)
+    assert _is_conversion_current(cached, entry, pdf)
+
+
+def test_changed_input_or_generator_rebuilds(tmp_path):
+    pdf, entry, cached = _setup(tmp_path)
+    assert not _is_conversion_current(cached, [9] + entry[1:], pdf)
+    assert not _is_conversion_current(cached, entry[:4] + ["0123456789ab"], pdf)
+    # Record written before the generator version was part of the entry
+    assert not _is_conversion_current(entry[:4] + cached[-1:], entry, pdf)
+    assert not _is_conversion_current(None, entry, pdf)
+
+
+def test_touched_or_missing_pdf_rebuilds(tmp_path):
+    pdf, entry, cached = _setup(tmp_path)
+    assert not _is_conversion_current(entry + [cached[-1] - 1], entry, pdf)
+    pdf.unlink()
+    assert not _is_conversion_current(cached, entry, pdf)
+
+
+def test_keep_html_needs_the_html(tmp_path):
+    pdf, entry, cached = _setup(tmp_path)
+    html = tmp_path / "f.html"
+    assert not _is_conversion_current(cached, entry, pdf, html)
+    html.write_text("<html></html>", encoding="utf-8")
+    assert _is_conversion_current(cached, entry, pdf, html)
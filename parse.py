@@ -113,7 +113,7 @@ async def process_split_result(
         print(f"Processing {basename}...")
         
         # Read split result
-        with open(split_result_path, "r") as f:
+        with open(split_result_path, "r", encoding="utf-8") as f:
             split_result_str = f.read().strip()
         
         # Extract SOI pages
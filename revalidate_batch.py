@@ -38,7 +38,7 @@ def main(batch_folder: str):
         stem = extract_file.stem.replace("_extract_response", "")
         
         try:
-            with open(extract_file, "r") as f:
+            with open(extract_file, "r", encoding="utf-8") as f:
                 extract_json = json.load(f)
             
             # Try to load split JSON if available
@@ -46,7 +46,7 @@ def main(batch_folder: str):
             split_json = None
             if split_file.exists():
                 try:
-                    with open(split_file, "r") as f:
+                    with open(split_file, "r", encoding="utf-8") as f:
                         split_json = json.load(f)
                 except Exception:
                     pass
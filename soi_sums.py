@@ -8,6 +8,9 @@ from typing import Any, Iterable, Optional
 
 NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
 
+# Keys holding citation/location metadata, which never contains rows
+NON_ROW_KEYS = frozenset({"citations", "bbox", "bounding_box", "page_coords"})
+
 
 def parse_numeric_value(raw: Any) -> Optional[Decimal]:
     """Convert a raw fair value string to Decimal, handling currency formatting."""
@@ -46,11 +49,12 @@ def parse_numeric_value(raw: Any) -> Optional[Decimal]:
 
 def is_holding(node: Any) -> bool:
     """Return True when a node represents a HOLDING row."""
-    if not isinstance(node, dict):
+    # Parsed JSON only holds plain dicts, so an exact type check is enough
+    if type(node) is not dict:
         return False
 
     row_type = node.get("row_type")
-    return isinstance(row_type, dict) and row_type.get("value") == "HOLDING"
+    return type(row_type) is dict and row_type.get("value") == "HOLDING"
 
 
 def find_fair_value_numbers(node: Any) -> Iterable[Decimal]:
@@ -63,7 +67,9 @@ def find_fair_value_numbers(node: Any) -> Iterable[Decimal]:
                 if number is not None:
                     yield number
 
-        for value in node.values():
+        for key, value in node.items():
+            if key in NON_ROW_KEYS:
+                continue
             yield from find_fair_value_numbers(value)
 
     elif isinstance(node, list):
@@ -28,7 +28,7 @@ def main():
         stem = extract_file.stem.replace("_extract_response", "")
         
         try:
-            with open(extract_file, "r") as f:
+            with open(extract_file, "r", encoding="utf-8") as f:
                 extract_json = json.load(f)
             
             # Sanitize soi_rows before validation to fix misclassified rows